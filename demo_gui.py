@@ -3,15 +3,25 @@
 GUI Demo Script - Shows how to launch the GUI
 """
 
+import os
 import sys
 import importlib.util
-from pathlib import Path
 
 # Add src to path
-project_root = Path(__file__).parent
-src_path = project_root / "src" / "mousecontroller"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+def _check_pyqt():
+    """Check that PyQt6 and the GUI module are importable
+    
+    Only locates the modules, so PyQt6 is not loaded just for the demo.
+    """
+    for module_name in ("PyQt6.QtWidgets",
+                        "mousecontroller.mouse_recorder_gui"):
+        if importlib.util.find_spec(module_name) is None:
+            raise ImportError(f"No module named '{module_name}'")
+
 
 def demo_gui():
     """Demo the GUI functionality"""
@@ -20,22 +30,9 @@ def demo_gui():
     print("=" * 60)
     
     try:
-        # Import using the same path resolution as other modules
-        # Get the path to the GUI module
-        gui_module_path = src_path / "mouse_recorder_gui.py"
-        
-        # Dynamic import to avoid linting issues
-        spec = importlib.util.spec_from_file_location("mouse_recorder_gui", gui_module_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Cannot load GUI module from {gui_module_path}")
-        
-        mouse_recorder_gui_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mouse_recorder_gui_module)
-        
-        MouseRecorderGUI = mouse_recorder_gui_module.MouseRecorderGUI
-        from PyQt6.QtWidgets import QApplication
+        _check_pyqt()
         
-        print("✅ Successfully imported GUI components")
+        print("✅ GUI components are available")
         print("✅ PyQt6 is available")
         print("✅ Mouse recorder modules are accessible")
         
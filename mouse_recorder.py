@@ -4,14 +4,13 @@ Mouse Recorder Main Launcher
 Launches the main entry point from the project root
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add src to path
-project_root = Path(__file__).parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 # Import and run main
 from mousecontroller.main import main
@@ -4,20 +4,19 @@ Mouse Recorder GUI Launcher
 Simple script to launch the GUI application via main.py
 """
 
+import os
 import sys
-from pathlib import Path
+
+# Add src to path
+SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 
 def main():
     """Main function to launch the GUI application"""
     print("Starting Mouse Recorder GUI...")
 
-    # Add src to path
-    project_root = Path(__file__).parent
-    src_path = project_root / "src"
-    if str(src_path) not in sys.path:
-        sys.path.insert(0, str(src_path))
-
     try:
         # Import and run the GUI via main entry point
         from mousecontroller.main import cmd_gui
@@ -0,0 +1,22 @@
+"""
+Import bootstrap for the mouse controller scripts.
+
+Modules inside the package (main.py, demo.py) can also be executed
+directly as scripts, where relative imports are unavailable. Importing
+this module puts ``src`` on ``sys.path`` once and loads the recorder and
+replayer through the regular package import, so they are cached in
+``sys.modules`` and their bytecode in ``__pycache__``.
+"""
+
+import os
+import sys
+
+SRC_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from mousecontroller.mouse_recorder import MouseRecorder  # noqa: E402
+from mousecontroller.mouse_replayer import MouseReplayer  # noqa: E402
+
+__all__ = ["MouseRecorder", "MouseReplayer", "SRC_PATH"]
@@ -6,19 +6,15 @@ Demonstrates how to use the mouse recording and replay functionality
 
 import os
 import sys
-from pathlib import Path
-
-# Add the utils directory to the Python path
-current_dir = Path(__file__).parent
-if str(current_dir) not in sys.path:
-    sys.path.insert(0, str(current_dir))
-
-# Import utilities and classes
-from utils import get_mousecontroller_modules
 
 # Import our modules
 try:
-    MouseRecorder, MouseReplayer = get_mousecontroller_modules(current_dir)
+    if __package__:
+        from .mouse_recorder import MouseRecorder
+        from .mouse_replayer import MouseReplayer
+    else:
+        # Executed as a script, _bootstrap makes the package importable
+        from _bootstrap import MouseRecorder, MouseReplayer  # type: ignore[no-redef]
 except ImportError as e:
     print(f"Error importing required modules: {e}")
     print("Please ensure mouse_recorder.py and mouse_replayer.py are in the "
@@ -7,20 +7,17 @@ Command-line interface for mouse recording and replay functionality
 import sys
 import os
 import argparse
-from pathlib import Path
-
-# Add current directory to path for imports
-current_dir = Path(__file__).parent
-if str(current_dir) not in sys.path:
-    sys.path.insert(0, str(current_dir))
-
-# Import utilities
-from utils import get_mousecontroller_modules, import_gui_module
-
+from collections import Counter
+from types import SimpleNamespace
 
 # Import our modules
 try:
-    MouseRecorder, MouseReplayer = get_mousecontroller_modules(current_dir)
+    if __package__:
+        from .mouse_recorder import MouseRecorder
+        from .mouse_replayer import MouseReplayer
+    else:
+        # Executed as a script, _bootstrap makes the package importable
+        from _bootstrap import MouseRecorder, MouseReplayer  # type: ignore[no-redef]
 except ImportError as e:
     print(f"Error importing required modules: {e}")
     print("Please ensure mouse_recorder.py and mouse_replayer.py are in the "
@@ -28,14 +25,37 @@ except ImportError as e:
     sys.exit(1)
 
 
+RECORDING_EXTENSIONS = (".json", ".jsonl", ".json.gz", ".jsonl.gz")
+# Metadata caches written next to recordings by MouseReplayer
+SIDECAR_SUFFIX = ".meta.json"
+
+MENU_TEXT = """
+🎯 What would you like to do?
+1. 🔴 Record mouse actions
+2. ▶️  Replay recording
+3. 🖥️  Launch GUI interface
+4. 📄 Show recording info
+5. 📁 List recordings
+6. ❓ Show help
+7. 🚪 Exit
+"""
+
+
+def write_lines(lines):
+    """Write several lines to stdout with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def show_banner():
     """Display application banner"""
-    print("=" * 80)
-    print("🐭 MOUSE RECORDER & REPLAYER")
-    print("=" * 80)
-    print("A comprehensive tool for recording and replaying mouse actions")
-    print("Version: 1.0.0")
-    print("=" * 80)
+    write_lines([
+        "=" * 80,
+        "🐭 MOUSE RECORDER & REPLAYER",
+        "=" * 80,
+        "A comprehensive tool for recording and replaying mouse actions",
+        "Version: 1.0.0",
+        "=" * 80,
+    ])
 
 
 def cmd_record(args):
@@ -45,13 +65,13 @@ def cmd_record(args):
     print("Move your mouse and click as needed. Press ESC to stop recording.")
     print("-" * 40)
     
-    recorder = MouseRecorder(args.output)
+    recorder = MouseRecorder(args.output, verbose=args.verbose)
     try:
         recorder.start_recording()
         print("\n✅ Recording completed successfully!")
         print(f"📁 File saved: {args.output}")
-        if recorder.events:
-            print(f"📊 Events recorded: {len(recorder.events)}")
+        if recorder.event_count:
+            print(f"📊 Events recorded: {recorder.event_count}")
     except KeyboardInterrupt:
         print("\n⚠️ Recording interrupted by user")
         recorder.stop_recording()
@@ -62,25 +82,47 @@ def cmd_record(args):
     return 0
 
 
+def open_recording(filename):
+    """Open a recording file for reading
+    
+    Mirrors what argparse.FileType does for the command line, so the
+    interactive menu can hand the same kind of object to the commands.
+    """
+    try:
+        return open(filename, 'rb')
+    except OSError:
+        print(f"❌ Recording file not found: {filename}")
+        return None
+
+
 def cmd_replay(args):
     """Handle replay command"""
-    if not os.path.exists(args.file):
-        print(f"❌ Recording file not found: {args.file}")
-        return 1
-        
-    print(f"Loading recording: {args.file}")
+    print(f"Loading recording: {args.file.name}")
     print(f"Replay speed: {args.speed}x")
     print(f"Start delay: {args.delay} seconds")
     print("-" * 40)
     
-    replayer = MouseReplayer(args.file)
+    replayer = MouseReplayer(args.file.name)
+    if replayer.wants_streaming(args.file):
+        # Large recordings are replayed while they are read
+        args.file.close()
+        try:
+            metadata = MouseReplayer.load_metadata(args.file.name)
+        except Exception:
+            metadata = None
+        replay = replayer.replay_streaming
+    else:
+        with args.file:
+            loaded = replayer.load_from_handle(args.file)
+        metadata = (replayer.recording_data.get('metadata', {})
+                    if loaded else None)
+        replay = replayer.replay
     
-    if not replayer.load_recording():
+    if metadata is None:
         print("❌ Failed to load recording file")
         return 1
         
     # Show recording info
-    metadata = replayer.recording_data.get('metadata', {})
     print("📄 Recording info:")
     print(f"   Duration: {metadata.get('duration', 0):.2f} seconds")
     print(f"   Events: {metadata.get('event_count', 0)}")
@@ -88,7 +130,7 @@ def cmd_replay(args):
     print()
     
     try:
-        replayer.replay(speed=args.speed, delay_start=args.delay)
+        replay(speed=args.speed, delay_start=args.delay)
         print("✅ Replay completed successfully!")
     except KeyboardInterrupt:
         print("\n⚠️ Replay interrupted by user")
@@ -102,8 +144,7 @@ def cmd_replay(args):
 def cmd_gui(args):
     """Handle GUI command"""
     try:
-        # Import GUI module dynamically
-        gui_module = import_gui_module(current_dir)
+        from mousecontroller import mouse_recorder_gui as gui_module
         print("🚀 Starting GUI application...")
         gui_module.main()
     except ImportError:
@@ -119,76 +160,79 @@ def cmd_gui(args):
 
 def cmd_info(args):
     """Handle info command"""
-    if not os.path.exists(args.file):
-        print(f"❌ Recording file not found: {args.file}")
-        return 1
-        
-    print(f"📄 Recording Information: {args.file}")
+    print(f"📄 Recording Information: {args.file.name}")
     print("-" * 40)
     
-    replayer = MouseReplayer(args.file)
-    if not replayer.load_recording():
+    replayer = MouseReplayer(args.file.name)
+    with args.file:
+        loaded = replayer.load_from_handle(args.file)
+    if not loaded:
         print("❌ Failed to load recording file")
         return 1
         
-    data = replayer.recording_data
-    metadata = data.get('metadata', {})
-    events = data.get('events', [])
+    metadata = replayer.recording_data.get('metadata', {})
     
     # Basic info
-    print(f"Created: {metadata.get('created_at', 'Unknown')}")
-    print(f"Duration: {metadata.get('duration', 0):.2f} seconds")
-    print(f"Total Events: {metadata.get('event_count', 0)}")
-    print(f"File Size: {os.path.getsize(args.file)} bytes")
+    lines = [
+        f"Created: {metadata.get('created_at', 'Unknown')}",
+        f"Duration: {metadata.get('duration', 0):.2f} seconds",
+        f"Total Events: {metadata.get('event_count', 0)}",
+        f"File Size: {replayer.file_size} bytes",
+    ]
     
     # Event breakdown
-    if events:
-        event_types = {}
-        for event in events:
-            event_type = event.get('type', 'unknown')
-            event_types[event_type] = event_types.get(event_type, 0) + 1
+    if replayer.types:
+        event_types = Counter(replayer.types)
             
-        print("\n📊 Event Breakdown:")
+        lines.append("\n📊 Event Breakdown:")
         for event_type, count in event_types.items():
-            print(f"   {event_type.capitalize()}: {count}")
+            lines.append(f"   {event_type.capitalize()}: {count}")
     
+    write_lines(lines)
     return 0
 
 
 def cmd_list_recordings(args):
     """Handle list command"""
-    data_dir = Path(args.directory)
-    if not data_dir.exists():
+    try:
+        with os.scandir(args.directory) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith(RECORDING_EXTENSIONS)
+                and not entry.name.endswith(SIDECAR_SUFFIX)
+                and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         print(f"📁 Directory not found: {args.directory}")
         return 1
         
-    print(f"📁 Recordings in: {args.directory}")
-    print("-" * 60)
-    
-    json_files = list(data_dir.glob("*.json"))
+    lines = [f"📁 Recordings in: {args.directory}", "-" * 60]
     
-    if not json_files:
-        print("No recording files found.")
+    if not entries:
+        lines.append("No recording files found.")
+        write_lines(lines)
         return 0
         
-    for file_path in sorted(json_files):
+    entries.sort(key=lambda entry: entry.name)
+    for entry in entries:
         try:
-            replayer = MouseReplayer(str(file_path))
-            if replayer.load_recording():
-                metadata = replayer.recording_data.get('metadata', {})
-                duration = metadata.get('duration', 0)
-                event_count = metadata.get('event_count', 0)
-                created_raw = metadata.get('created_at', 'Unknown')
-                created = created_raw[:19].replace('T', ' ')
-                
-                print(f"📄 {file_path.name}")
-                print(f"   Created: {created}")
-                print(f"   Duration: {duration:.2f}s | Events: {event_count}")
-                print()
+            # Only the metadata is displayed, so skip building the events
+            metadata = MouseReplayer.load_metadata(entry.path)
+            duration = metadata.get('duration', 0)
+            event_count = metadata.get('event_count', 0)
+            created_raw = metadata.get('created_at', 'Unknown')
+            created = created_raw[:19].replace('T', ' ')
+
+            lines.extend([
+                f"📄 {entry.name}",
+                f"   Created: {created}",
+                f"   Duration: {duration:.2f}s | Events: {event_count}",
+                "",
+            ])
         except Exception:
-            print(f"❌ {file_path.name} (corrupted or invalid)")
-            print()
+            lines.extend([f"❌ {entry.name} (corrupted or invalid)", ""])
     
+    write_lines(lines)
     return 0
 
 
@@ -201,6 +245,8 @@ def create_parser():
         epilog="""
 Examples:
   %(prog)s record -o my_recording.json          # Record mouse actions
+  %(prog)s record -o my_recording.jsonl         # Stream events to JSON Lines
+  %(prog)s record -o my_recording.jsonl.gz      # Save gzip compressed
   %(prog)s replay my_recording.json             # Replay at normal speed
   %(prog)s replay my_recording.json -s 0.5      # Replay at half speed
   %(prog)s replay my_recording.json -s 2 -d 5   # Double speed with 5s delay
@@ -221,7 +267,14 @@ Examples:
     record_parser.add_argument(
         '-o', '--output',
         default='data/mouse_recording.json',
-        help='Output file path (default: data/mouse_recording.json)'
+        help='Output file path, use a .jsonl extension to stream events '
+             'to disk while recording or .jsonl.gz to save them gzip '
+             'compressed (default: data/mouse_recording.json)'
+    )
+    record_parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Print every click and scroll as it is recorded'
     )
     record_parser.set_defaults(func=cmd_record)
     
@@ -229,7 +282,9 @@ Examples:
     replay_parser = subparsers.add_parser(
         'replay', help='Replay mouse actions'
     )
-    replay_parser.add_argument('file', help='Recording file to replay')
+    replay_parser.add_argument(
+        'file', type=argparse.FileType('rb'), help='Recording file to replay'
+    )
     replay_parser.add_argument(
         '-s', '--speed',
         type=float,
@@ -252,7 +307,9 @@ Examples:
     info_parser = subparsers.add_parser(
         'info', help='Show recording information'
     )
-    info_parser.add_argument('file', help='Recording file to analyze')
+    info_parser.add_argument(
+        'file', type=argparse.FileType('rb'), help='Recording file to analyze'
+    )
     info_parser.set_defaults(func=cmd_info)
     
     # List command
@@ -267,112 +324,132 @@ Examples:
     return parser
 
 
+_parser = None
+
+
+def get_parser():
+    """Return the command line parser, building it on first use"""
+    global _parser
+    if _parser is None:
+        _parser = create_parser()
+    return _parser
+
+
+def _menu_record():
+    """Interactive menu: record mouse actions"""
+    filename_prompt = ("Enter output filename "
+                       "(default: data/mouse_recording.json): ")
+    filename = input(filename_prompt).strip()
+    if not filename:
+        filename = "data/mouse_recording.json"
+    
+    result = cmd_record(SimpleNamespace(output=filename, verbose=False))
+    if result == 0:
+        input("\nPress Enter to continue...")
+
+
+def _menu_replay():
+    """Interactive menu: replay a recording"""
+    filename = input("Enter recording filename: ").strip()
+    if not filename:
+        print("❌ Filename required")
+        return
+        
+    speed_input = input("Enter replay speed (default: 1.0): ").strip()
+    try:
+        replay_speed = float(speed_input) if speed_input else 1.0
+    except ValueError:
+        replay_speed = 1.0
+        
+    delay_input = input(
+        "Enter start delay in seconds (default: 3): "
+    ).strip()
+    try:
+        start_delay = int(delay_input) if delay_input else 3
+    except ValueError:
+        start_delay = 3
+    
+    recording = open_recording(filename)
+    if recording is None:
+        return
+    
+    result = cmd_replay(SimpleNamespace(
+        file=recording, speed=replay_speed, delay=start_delay
+    ))
+    if result == 0:
+        input("\nPress Enter to continue...")
+
+
+def _menu_gui():
+    """Interactive menu: launch the GUI"""
+    cmd_gui(SimpleNamespace())
+
+
+def _menu_info():
+    """Interactive menu: show recording information"""
+    filename = input("Enter recording filename: ").strip()
+    if not filename:
+        print("❌ Filename required")
+        return
+        
+    recording = open_recording(filename)
+    if recording is None:
+        return
+        
+    cmd_info(SimpleNamespace(file=recording))
+    input("\nPress Enter to continue...")
+
+
+def _menu_list():
+    """Interactive menu: list recordings"""
+    directory = input("Enter directory (default: data): ").strip()
+    if not directory:
+        directory = "data"
+        
+    cmd_list_recordings(SimpleNamespace(directory=directory))
+    input("\nPress Enter to continue...")
+
+
+def _menu_help():
+    """Interactive menu: show command line help"""
+    get_parser().print_help()
+    input("\nPress Enter to continue...")
+
+
+# Menu choices (choice '7' exits the menu loop)
+_HANDLERS = {
+    '1': _menu_record,
+    '2': _menu_replay,
+    '3': _menu_gui,
+    '4': _menu_info,
+    '5': _menu_list,
+    '6': _menu_help,
+}
+
+
 def interactive_menu():
     """Show interactive menu when no command is provided"""
     show_banner()
     
     while True:
-        print("\n🎯 What would you like to do?")
-        print("1. 🔴 Record mouse actions")
-        print("2. ▶️  Replay recording")
-        print("3. 🖥️  Launch GUI interface")
-        print("4. 📄 Show recording info")
-        print("5. 📁 List recordings")
-        print("6. ❓ Show help")
-        print("7. 🚪 Exit")
+        sys.stdout.write(MENU_TEXT)
         
         choice = input("\nEnter your choice (1-7): ").strip()
         
-        if choice == '1':
-            filename_prompt = ("Enter output filename "
-                               "(default: data/mouse_recording.json): ")
-            filename = input(filename_prompt).strip()
-            if not filename:
-                filename = "data/mouse_recording.json"
-            
-            # Create args object
-            class RecordArgs:
-                output = filename
-            
-            result = cmd_record(RecordArgs())
-            if result == 0:
-                input("\nPress Enter to continue...")
-                
-        elif choice == '2':
-            filename = input("Enter recording filename: ").strip()
-            if not filename:
-                print("❌ Filename required")
-                continue
-                
-            speed_input = input("Enter replay speed (default: 1.0): ").strip()
-            try:
-                replay_speed = float(speed_input) if speed_input else 1.0
-            except ValueError:
-                replay_speed = 1.0
-                
-            delay_input = input(
-                "Enter start delay in seconds (default: 3): "
-            ).strip()
-            try:
-                start_delay = int(delay_input) if delay_input else 3
-            except ValueError:
-                start_delay = 3
-            
-            class ReplayArgs:
-                file = filename
-                speed = replay_speed
-                delay = start_delay
-                
-            result = cmd_replay(ReplayArgs())
-            if result == 0:
-                input("\nPress Enter to continue...")
-                
-        elif choice == '3':
-            class GuiArgs:
-                pass
-            cmd_gui(GuiArgs())
-            
-        elif choice == '4':
-            filename = input("Enter recording filename: ").strip()
-            if not filename:
-                print("❌ Filename required")
-                continue
-                
-            class InfoArgs:
-                file = filename
-                
-            cmd_info(InfoArgs())
-            input("\nPress Enter to continue...")
-            
-        elif choice == '5':
-            directory_input = input(
-                "Enter directory (default: data): "
-            ).strip()
-            if not directory_input:
-                directory_input = "data"
-                
-            class ListArgs:
-                directory = directory_input
-                
-            cmd_list_recordings(ListArgs())
-            input("\nPress Enter to continue...")
-            
-        elif choice == '6':
-            parser = create_parser()
-            parser.print_help()
-            input("\nPress Enter to continue...")
-            
-        elif choice == '7':
+        if choice == '7':
             print("👋 Goodbye!")
             break
             
+        handler = _HANDLERS.get(choice)
+        if handler:
+            handler()
         else:
             print("❌ Invalid choice. Please try again.")
 
 
 def main():
     """Main function - entry point for the application"""
-    parser = create_parser()
+    parser = get_parser()
     
     # If no arguments provided, show interactive menu
     if len(sys.argv) == 1:
@@ -4,24 +4,142 @@ Mouse Recorder - Records mouse movements, clicks, and scroll actions
 Press ESC to stop recording
 """
 
+import gzip
 import json
 import time
 from datetime import datetime
-from pynput import mouse
+from pynput import keyboard, mouse
 from pynput.mouse import Button
 import threading
 import os
+import queue
+from itertools import islice
+from array import array
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+# Recordings whose file name ends with this extension are written as JSON
+# Lines: a metadata header line followed by one event per line
+JSONL_EXTENSION = ".jsonl"
+
+# Recordings whose file name ends with this suffix after the extension are
+# gzip compressed and written once at the end of the recording
+GZIP_SUFFIX = ".gz"
+
+# Compression level for gzip recordings, mouse coordinates compress well
+# at low levels so speed is favored
+GZIP_COMPRESS_LEVEL = 3
+
+# The metadata header of a JSON Lines recording is padded to a fixed width
+# so it can be rewritten in place once the final duration/count are known
+JSONL_HEADER_SIZE = 256
+
+# Most queued events the stream writer thread serializes per write
+STREAM_BATCH_SIZE = 1024
+
+# Event types as small integer codes in the recording columns, matching
+# the codes used by MouseReplayer
+TYPE_MOVE, TYPE_CLICK, TYPE_SCROLL = 0, 1, 2
+
+# Clicked buttons as small integer codes in the recording columns; saved
+# recordings still name the button
+_BUTTON_NAMES = tuple(button.name for button in Button)
+_BUTTON_CODES = {button: code for code, button in enumerate(Button)}
+
+# A move within this many pixels (x plus y distance) of the last kept move
+# and within this many nanoseconds of it is sensor jitter and is dropped
+MOVE_MIN_DISTANCE = 2
+MOVE_MIN_INTERVAL_NS = 8_000_000
+
+
+def _loads(data):
+    """Decode a JSON document, preferring orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """Encode a recording as indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _dumps_line(obj):
+    """Encode an object as compact single-line JSON text"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _number(value):
+    """Return a float column value as int when it holds a whole number"""
+    return int(value) if value.is_integer() else value
+
+
+def _is_jsonl(filename):
+    """Check whether a recording file name is JSON Lines, compressed or not"""
+    if filename.endswith(GZIP_SUFFIX):
+        filename = filename[:-len(GZIP_SUFFIX)]
+    return filename.endswith(JSONL_EXTENSION)
+
+
+def _open_recording(filename, mode):
+    """Open a recording file in binary mode, gzip compressed by suffix"""
+    if filename.endswith(GZIP_SUFFIX):
+        return gzip.open(filename, mode, compresslevel=GZIP_COMPRESS_LEVEL)
+    return open(filename, mode)
+
+
+def _jsonl_header(metadata):
+    """Build the fixed-width metadata header line of a JSON Lines file"""
+    line = _dumps_line({"metadata": metadata})
+    # Trailing spaces are insignificant JSON whitespace
+    return line.ljust(JSONL_HEADER_SIZE - 1) + "\n"
+
+
+def _parse_jsonl(data):
+    """Parse a JSON Lines recording into the regular recording layout"""
+    lines = data.splitlines()
+    metadata = _loads(lines[0]).get("metadata", {}) if lines else {}
+    events = [_loads(line) for line in lines[1:] if line.strip()]
+    return {"metadata": metadata, "events": events}
 
 
 class MouseRecorder:
-    def __init__(self, output_file="mouse_recording.json"):
+    def __init__(self, output_file="mouse_recording.json", verbose=False,
+                 save_executor=None):
         self.output_file = output_file
-        self.events = []
+        # Printing from the listener thread stalls the input hook, so
+        # per-event clicks and scrolls are only echoed when asked for
+        self.verbose = verbose
+        self._reset_columns()
         self.start_time = 0.0
+        # Event timestamps are monotonic nanoseconds since _start_ns; the
+        # clock is bound once so callbacks skip the module lookup
+        self._clock_ns = time.perf_counter_ns
+        self._start_ns = 0
+        self.move_min_distance = MOVE_MIN_DISTANCE
+        self.move_min_interval_ns = MOVE_MIN_INTERVAL_NS
         self.recording = False
         self.listener = None
         self.timer_thread = None
         self.timer_stop_event = threading.Event()
+        # Set by ESC or stop_recording to release the monitoring thread
+        self.stop_requested = threading.Event()
+        self._stream = None
+        # Output directory already created, skipped on later saves
+        self._ready_dir = None
+        self._stream_queue = queue.SimpleQueue()
+        self._stream_writer = None
+        # When set, stop_recording submits the save here instead of
+        # writing the file itself; save_future tracks the latest save
+        self.save_executor = save_executor
+        self.save_future = None
         
     def start_recording(self):
         """Start recording mouse events"""
@@ -29,10 +147,7 @@ class MouseRecorder:
         print(f"Recording will be saved to: {self.output_file}")
         print("Recording time: 00:00:00", end="", flush=True)
         
-        self.recording = True
-        self.start_time = time.time()
-        self.events = []
-        self.timer_stop_event.clear()
+        self._start_session()
         
         # Start timer display thread
         self.timer_thread = threading.Thread(target=self._display_timer)
@@ -50,6 +165,127 @@ class MouseRecorder:
         
         # Monitor for ESC key to stop recording
         self._monitor_stop_key()
+
+    def _start_session(self):
+        """Reset the recording state and open the event stream if needed"""
+        self.recording = True
+        self.start_time = time.time()
+        self._start_ns = self._clock_ns()
+        self._reset_columns()
+        self.timer_stop_event.clear()
+        self.stop_requested.clear()
+
+        if self.output_file.endswith(JSONL_EXTENSION):
+            self._open_stream()
+
+    def _open_stream(self):
+        """Open a JSON Lines output file that events are appended to"""
+        self._ensure_output_dir()
+
+        stream = open(self.output_file, 'w', encoding='utf-8')
+        stream.write(_jsonl_header({
+            "created_at": datetime.now().isoformat(),
+            "duration": 0.0,
+            "event_count": 0
+        }))
+        stream.flush()
+
+        # Events are serialized and written off the listener thread
+        self._stream_queue = queue.SimpleQueue()
+        self._stream_writer = threading.Thread(
+            target=self._stream_writer_loop, args=(stream,), daemon=True
+        )
+        self._stream_writer.start()
+        self._stream = stream
+
+    def _stream_writer_loop(self, stream):
+        """Drain queued events to the stream in batches until None arrives"""
+        get = self._stream_queue.get
+        get_nowait = self._stream_queue.get_nowait
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < STREAM_BATCH_SIZE:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+            lines = [_dumps_line(event) for event in batch
+                     if event is not None]
+            try:
+                if lines:
+                    stream.write("\n".join(lines) + "\n")
+                    # Flushed per batch so events reach the file while
+                    # recording
+                    stream.flush()
+            except Exception as e:
+                print(f"Error writing recording: {e}")
+            if None in batch:
+                return
+
+    def _reset_columns(self):
+        """Start empty per-event columns for the listener callbacks
+        
+        Every event stores its type, position and timestamp. Button and
+        pressed state are kept only for clicks and dx/dy only for scrolls,
+        in the order those events occur. Callbacks append the timestamp
+        last, so the columns read consistently while recording.
+        """
+        self._types = array('b')
+        self._xs = array('d')
+        self._ys = array('d')
+        self._timestamps = array('q')
+        self._buttons = array('b')
+        self._pressed = array('b')
+        self._dxs = array('d')
+        self._dys = array('d')
+        # Bound appends save the callbacks a lookup per column
+        self._add_type = self._types.append
+        self._add_x = self._xs.append
+        self._add_y = self._ys.append
+        self._add_timestamp = self._timestamps.append
+        self._add_button = self._buttons.append
+        self._add_pressed = self._pressed.append
+        self._add_dx = self._dxs.append
+        self._add_dy = self._dys.append
+        # Last kept move and the latest move dropped since then
+        self._last_mx = self._last_my = float('inf')
+        self._last_mts = 0
+        self._pending_move = None
+
+    @property
+    def event_count(self):
+        """Number of events recorded so far"""
+        return len(self._timestamps)
+
+    @property
+    def events(self):
+        """Recorded events as dicts in recording order, built on access"""
+        return list(self.iter_events())
+
+    def iter_events(self):
+        """Yield the recorded events as dicts in recording order"""
+        clicks = zip(self._buttons, self._pressed)
+        scrolls = zip(self._dxs, self._dys)
+        for code, x, y, timestamp in zip(self._types, self._xs, self._ys,
+                                         self._timestamps):
+            x, y = _number(x), _number(y)
+            timestamp /= 1e9
+            if code == TYPE_MOVE:
+                yield {"type": "move", "x": x, "y": y,
+                       "timestamp": timestamp}
+            elif code == TYPE_CLICK:
+                button, pressed = next(clicks)
+                yield {"type": "click", "x": x, "y": y,
+                       "button": _BUTTON_NAMES[button],
+                       "pressed": bool(pressed), "timestamp": timestamp}
+            else:
+                dx, dy = next(scrolls)
+                yield {"type": "scroll", "x": x, "y": y, "dx": _number(dx),
+                       "dy": _number(dy), "timestamp": timestamp}
+
+    def _write_event(self, event):
+        """Queue an event for the stream writer thread"""
+        self._stream_queue.put(event)
         
     def stop_recording(self):
         """Stop recording and save to file"""
@@ -63,15 +299,22 @@ class MouseRecorder:
         if self.timer_thread and self.timer_thread.is_alive():
             self.timer_thread.join(timeout=1.0)
         
+        # pynput delivers no events once stop() returns, which is what
+        # keeps the callbacks free of a per-event recording check
         if self.listener:
             self.listener.stop()
         
-        self.save_recording()
+        self._flush_pending_move()
+        if self.save_executor is None:
+            self.save_recording()
+        else:
+            self.save_future = self.save_executor.submit(self.save_recording)
         duration = (time.time() - self.start_time
                     if self.start_time > 0 else 0.0)
-        print(f"\n\nRecording stopped. {len(self.events)} events recorded.")
+        print(f"\n\nRecording stopped. {self.event_count} events recorded.")
         print(f"Total recording time: {self._format_time(duration)}")
         print(f"Recording saved to: {self.output_file}")
+        self.stop_requested.set()
     
     def _display_timer(self):
         """Display the elapsed recording time in real-time"""
@@ -94,61 +337,91 @@ class MouseRecorder:
         
     def on_move(self, x, y):
         """Handle mouse move events"""
-        if not self.recording:
+        timestamp = self._clock_ns() - self._start_ns
+        if (abs(x - self._last_mx) + abs(y - self._last_my)
+                < self.move_min_distance and
+                timestamp - self._last_mts < self.move_min_interval_ns):
+            self._pending_move = (x, y, timestamp)
             return
-            
-        event = {
-            "type": "move",
-            "x": x,
-            "y": y,
-            "timestamp": time.time() - self.start_time
-        }
-        self.events.append(event)
+        self._flush_pending_move()
+        self._append_move(x, y, timestamp)
+
+    def _append_move(self, x, y, timestamp):
+        """Record a kept move and make it the new jitter reference"""
+        self._last_mx, self._last_my, self._last_mts = x, y, timestamp
+        self._add_type(TYPE_MOVE)
+        self._add_x(x)
+        self._add_y(y)
+        self._add_timestamp(timestamp)
+        if self._stream is not None:
+            self._write_event({
+                "type": "move",
+                "x": x,
+                "y": y,
+                "timestamp": timestamp / 1e9
+            })
+
+    def _flush_pending_move(self):
+        """Record the last dropped move so the cursor ends where it was"""
+        if self._pending_move is not None:
+            pending, self._pending_move = self._pending_move, None
+            self._append_move(*pending)
         
     def on_click(self, x, y, button, pressed):
         """Handle mouse click events"""
-        if not self.recording:
-            return
-            
-        event = {
-            "type": "click",
-            "x": x,
-            "y": y,
-            "button": button.name,
-            "pressed": pressed,
-            "timestamp": time.time() - self.start_time
-        }
-        self.events.append(event)
-        action = 'Press' if pressed else 'Release'
-        print(f"{action} {button.name} at ({x}, {y})")
+        timestamp = self._clock_ns() - self._start_ns
+        self._flush_pending_move()
+        self._add_button(_BUTTON_CODES[button])
+        self._add_pressed(pressed)
+        self._add_type(TYPE_CLICK)
+        self._add_x(x)
+        self._add_y(y)
+        self._add_timestamp(timestamp)
+        if self._stream is not None:
+            self._write_event({
+                "type": "click",
+                "x": x,
+                "y": y,
+                "button": button.name,
+                "pressed": pressed,
+                "timestamp": timestamp / 1e9
+            })
+        if self.verbose:
+            action = 'Press' if pressed else 'Release'
+            print(f"{action} {button.name} at ({x}, {y})")
         
     def on_scroll(self, x, y, dx, dy):
         """Handle mouse scroll events"""
-        if not self.recording:
-            return
-            
-        event = {
-            "type": "scroll",
-            "x": x,
-            "y": y,
-            "dx": dx,
-            "dy": dy,
-            "timestamp": time.time() - self.start_time
-        }
-        self.events.append(event)
-        print(f"Scroll at ({x}, {y}) - dx: {dx}, dy: {dy}")
+        timestamp = self._clock_ns() - self._start_ns
+        self._flush_pending_move()
+        self._add_dx(dx)
+        self._add_dy(dy)
+        self._add_type(TYPE_SCROLL)
+        self._add_x(x)
+        self._add_y(y)
+        self._add_timestamp(timestamp)
+        if self._stream is not None:
+            self._write_event({
+                "type": "scroll",
+                "x": x,
+                "y": y,
+                "dx": dx,
+                "dy": dy,
+                "timestamp": timestamp / 1e9
+            })
+        if self.verbose:
+            print(f"Scroll at ({x}, {y}) - dx: {dx}, dy: {dy}")
         
     def _monitor_stop_key(self):
         """Monitor for ESC key press to stop recording"""
-        from pynput import keyboard
         
         def on_key_press(key):
             try:
                 if key == keyboard.Key.esc:
                     print("\n\nESC pressed - stopping recording...")
-                    self.stop_recording()
+                    self.stop_requested.set()
                     # Return False to stop the listener
-                    keyboard_listener.stop()
+                    return False
             except AttributeError:
                 pass
                 
@@ -162,38 +435,87 @@ class MouseRecorder:
             on_release=on_key_release
         )
         keyboard_listener.start()
-        keyboard_listener.join()
+        # Wait on the event rather than the listener, so a stop requested
+        # without ESC also ends the wait
+        self.stop_requested.wait()
+        keyboard_listener.stop()
+        # Save on this thread instead of inside the keyboard hook
+        self.stop_recording()
         
     def save_recording(self):
         """Save recorded events to JSON file"""
         duration = (time.time() - self.start_time
                     if self.start_time > 0 else 0.0)
-        recording_data = {
-            "metadata": {
-                "created_at": datetime.now().isoformat(),
-                "duration": duration,
-                "event_count": len(self.events)
-            },
-            "events": self.events
+        metadata = {
+            "created_at": datetime.now().isoformat(),
+            "duration": duration,
+            "event_count": self.event_count
         }
+
+        if self._stream is not None:
+            # Events are already on disk, only the header needs updating
+            self._close_stream(metadata)
+            return
+
+        self._ensure_output_dir()
         
-        # Create directory if it doesn't exist
-        output_dir = os.path.dirname(os.path.abspath(self.output_file))
-        os.makedirs(output_dir, exist_ok=True)
+        try:
+            with _open_recording(self.output_file, 'wb') as f:
+                if _is_jsonl(self.output_file):
+                    self._write_jsonl(f, metadata)
+                else:
+                    f.write(_dumps({
+                        "metadata": metadata,
+                        "events": self.events
+                    }))
+        except Exception as e:
+            print(f"Error saving recording: {e}")
+
+    def _write_jsonl(self, f, metadata):
+        """Write the recording as JSON Lines, serializing events in batches
         
+        Event dicts are built from the columns as they are written, so the
+        full event list is never held in memory.
+        """
+        f.write((_dumps_line({"metadata": metadata}) + "\n").encode('utf-8'))
+        events = self.iter_events()
+        while True:
+            lines = [_dumps_line(event)
+                     for event in islice(events, STREAM_BATCH_SIZE)]
+            if not lines:
+                return
+            f.write(("\n".join(lines) + "\n").encode('utf-8'))
+
+    def _ensure_output_dir(self):
+        """Create the output file's directory once per output location"""
+        output_dir = os.path.dirname(os.path.abspath(self.output_file))
+        if output_dir != self._ready_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            self._ready_dir = output_dir
+
+    def _close_stream(self, metadata):
+        """Rewrite the JSON Lines header with final metadata and close"""
+        stream, self._stream = self._stream, None
+        # None tells the writer to finish the queued events and exit
+        self._stream_queue.put(None)
+        self._stream_writer.join()
         try:
-            with open(self.output_file, 'w') as f:
-                json.dump(recording_data, f, indent=2)
+            stream.seek(0)
+            stream.write(_jsonl_header(metadata))
         except Exception as e:
             print(f"Error saving recording: {e}")
+        finally:
+            stream.close()
             
     def load_recording(self, filename=None):
         """Load recording from JSON file"""
         file_to_load = filename or self.output_file
         
         try:
-            with open(file_to_load, 'r') as f:
-                data = json.load(f)
+            with _open_recording(file_to_load, 'rb') as f:
+                if _is_jsonl(file_to_load):
+                    return _parse_jsonl(f.read())
+                data = _loads(f.read())
                 return data
         except FileNotFoundError:
             print(f"Recording file not found: {file_to_load}")
@@ -7,47 +7,205 @@ Provides an easy-to-use interface for recording and replaying mouse actions
 
 import sys
 import os
-import json
 import time
 import threading
-from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QTextEdit, QGroupBox, QSlider,
+    QPushButton, QLabel, QLineEdit, QScrollArea, QGroupBox, QSlider,
     QSpinBox, QDoubleSpinBox, QFileDialog, QMessageBox, QProgressBar,
-    QCheckBox, QTabWidget
+    QCheckBox, QTabWidget, QRadioButton, QButtonGroup
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import (
+    QFileSystemWatcher, QThread, QTimer, pyqtSignal, Qt
+)
+from pynput import mouse
+from pynput.keyboard import Key, Controller
+
+# Import our modules
+if __package__:
+    from .mouse_recorder import MouseRecorder
+    from .mouse_replayer import MouseReplayer
+else:
+    # Executed as a script, _bootstrap makes the package importable
+    from _bootstrap import MouseRecorder, MouseReplayer  # type: ignore[no-redef]
 
-# Add current directory to path for imports
-current_dir = Path(__file__).parent
-if str(current_dir) not in sys.path:
-    sys.path.insert(0, str(current_dir))
 
+# Index of the replay tab page
+REPLAY_TAB = 1
 
-# Import utilities and classes
-from utils import get_mousecontroller_modules
+# Quiet period after the last path edit before file info is refreshed
+FILE_INFO_DEBOUNCE_MS = 250
+
+# How often the GUI reads replay progress from the replay thread
+REPLAY_POLL_INTERVAL_MS = 100
+
+# How long to wait for a worker thread to stop cooperatively before
+# reporting that the GUI is still waiting on it
+THREAD_STOP_TIMEOUT_MS = 2000
+
+# Application wide stylesheet, applied once in main(). Widget specific
+# rules select on objectName (#name) or the "class" dynamic property
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #f0f0f0;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        background-color: #4CAF50;
+        border: none;
+        color: white;
+        padding: 10px 20px;
+        text-align: center;
+        font-size: 14px;
+        border-radius: 5px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QPushButton[class="record-button"] {
+        background-color: #ff4444;
+    }
+    QPushButton[class="record-button"]:hover {
+        background-color: #cc3333;
+    }
+    QPushButton[class="stop-button"] {
+        background-color: #ff8800;
+    }
+    QPushButton[class="stop-button"]:hover {
+        background-color: #cc6600;
+    }
+    QPushButton[class="record-button"]:disabled,
+    QPushButton[class="stop-button"]:disabled {
+        background-color: #cccccc;
+    }
+    QLabel[class="status-label"] {
+        font-size: 14px;
+        color: #333;
+    }
+    QLabel[class="hint-label"] {
+        font-size: 12px;
+        color: #666;
+    }
+    QGroupBox#timerContainer {
+        font-size: 12px;
+        font-weight: bold;
+        color: #333;
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #f8f9fa;
+    }
+    QGroupBox#timerContainer::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        color: #666;
+    }
+    QLabel#recordingTimer {
+        font-family: 'Courier New', monospace;
+        font-size: 32px;
+        font-weight: bold;
+        color: #dc3545;
+        background-color: #000;
+        border: 3px solid #333;
+        border-radius: 8px;
+        padding: 10px 20px;
+        margin: 5px;
+    }
+    QLabel#timerStatus {
+        font-size: 14px;
+        font-weight: bold;
+        color: #dc3545;
+        background-color: transparent;
+        padding: 5px;
+    }
+    QLabel#timerStatus[blink="off"] {
+        color: #6c757d;
+    }
+"""
+
+@lru_cache(maxsize=16)
+def _cached_metadata(filename, mtime_ns, size):
+    """Parse a recording's metadata, cached per file version"""
+    return MouseReplayer.load_metadata(filename)
+
+
+def load_file_metadata(filename, st):
+    """Return a recording's metadata, only re-reading changed files
+    
+    The file info panels refresh on every edit of the path fields, so the
+    parse is keyed by path, modification time and size. The caller passes
+    the os.stat result it already has, which also provides the file size.
+    """
+    return _cached_metadata(filename, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=None)
+def keyboard_controller():
+    """Return the shared keyboard controller used to send the stop key"""
+    return Controller()
 
-# Import our modules
-try:
-    MouseRecorder, MouseReplayer = get_mousecontroller_modules(current_dir)
-except ImportError as e:
-    print(f"Error importing required modules: {e}")
-    sys.exit(1)
+
+def format_file_info(filename, footer=""):
+    """Build the text of a file info panel, runs on the info executor"""
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return f"File does not exist: {filename}"
+        
+    try:
+        metadata = load_file_metadata(filename, st)
+    except Exception as e:
+        return f"Error reading file: {e}"
+        
+    info = f"""File: {filename}
+Created: {metadata.get('created_at', 'Unknown')}
+Duration: {metadata.get('duration', 0):.2f} seconds
+Events: {metadata.get('event_count', 0)}
+File Size: {st.st_size} bytes"""
+    return info + footer
 
 
 class RecorderThread(QThread):
     """Thread for handling mouse recording"""
     recording_started = pyqtSignal()
     recording_stopped = pyqtSignal(str, int)  # filename, event_count
+    recording_saved = pyqtSignal(str, int)  # filename, event_count
     recording_error = pyqtSignal(str)
-    timer_update = pyqtSignal(str)  # timer display string
-    status_blink = pyqtSignal(bool)  # blinking status indicator
+    # {'seq', 'time', 'blink'}: timer display string and indicator state
+    timer_state = pyqtSignal(dict)
     
-    def __init__(self, output_file: str) -> None:
+    def __init__(self, output_file: str,
+                 save_executor: ThreadPoolExecutor) -> None:
         super().__init__()
         self.output_file = output_file
+        self.save_executor = save_executor
         self.recorder = None
+        self.timer_seq = 0  # Sequence number of the latest timer_state
+        # Create the keyboard controller now rather than when stopping
+        keyboard_controller()
         
     def run(self) -> None:
         try:
@@ -56,33 +214,35 @@ class RecorderThread(QThread):
             self.recording_started.emit()
             self.recorder.start_recording()
             # Recording stops when ESC is pressed
-            event_count = (
-                len(self.recorder.events) if self.recorder.events else 0
-            )
+            event_count = self.recorder.event_count
             self.recording_stopped.emit(self.output_file, event_count)
+            future = self.recorder.save_future
+            if future is not None:
+                future.add_done_callback(
+                    lambda _: self.recording_saved.emit(self.output_file,
+                                                        event_count)
+                )
         except Exception as e:
             self.recording_error.emit(str(e))
     
     def _create_gui_recorder(self, output_file: str) -> Any:
         """Create a MouseRecorder with GUI timer updates"""
-        recorder = MouseRecorder(output_file)
-        
-        # Import mouse from pynput for listener
-        from pynput import mouse
+        # The file is written on the save executor instead of blocking the
+        # stop; run() reports recording_saved once that finishes
+        recorder = MouseRecorder(output_file,
+                                 save_executor=self.save_executor)
         
         # Override the start_recording method to not print console messages
         def gui_start_recording():
-            recorder.recording = True
-            recorder.start_time = time.time()
-            recorder.events = []
-            recorder.timer_stop_event.clear()
+            recorder._start_session()
             
             # Start timer display thread (GUI version)
             recorder.timer_thread = threading.Thread(target=gui_display_timer)
             recorder.timer_thread.daemon = True
             recorder.timer_thread.start()
             
-            # Start mouse listener
+            # Start mouse listener; on_move drops jitter itself and keeps
+            # the last position of a burst, like the command line recorder
             recorder.listener = mouse.Listener(
                 on_move=recorder.on_move,
                 on_click=recorder.on_click,
@@ -96,24 +256,27 @@ class RecorderThread(QThread):
         
         # Override the _display_timer method to emit GUI updates
         def gui_display_timer():
-            blink_counter = 0
+            last_state = None
             while not recorder.timer_stop_event.is_set():
                 if recorder.recording and recorder.start_time > 0:
                     elapsed = time.time() - recorder.start_time
                     time_str = recorder._format_time(elapsed)
-                    # Emit just the time string for GUI display
-                    self.timer_update.emit(time_str)
+                    # Indicator is shown for the first half of each second
+                    blink = (elapsed % 1.0) < 0.5
                     
-                    # Emit blinking status every 10 cycles (1 second)
-                    blink_counter += 1
-                    if blink_counter >= 10:
-                        self.status_blink.emit(True)
-                        blink_counter = 0
-                    elif blink_counter == 5:
-                        self.status_blink.emit(False)
+                    # One emission per tick at most, and only when the
+                    # display would actually change
+                    if (time_str, blink) != last_state:
+                        last_state = (time_str, blink)
+                        self.timer_seq += 1
+                        self.timer_state.emit({
+                            'seq': self.timer_seq,
+                            'time': time_str,
+                            'blink': blink
+                        })
                 
-                # Update every 0.1 seconds for smooth display
-                recorder.timer_stop_event.wait(0.1)
+                # Second resolution display does not need 10Hz polling
+                recorder.timer_stop_event.wait(0.25)
         
         # Override methods that print to console
         recorder.start_recording = gui_start_recording
@@ -125,17 +288,11 @@ class RecorderThread(QThread):
         """Stop recording by simulating ESC key press - same as manual ESC"""
         if self.recorder and self.recorder.recording:
             try:
-                # Import pynput to simulate ESC key press
-                from pynput.keyboard import Key, Controller
+                # Send ESC through the shared keyboard controller
+                controller = keyboard_controller()
+                controller.press(Key.esc)
+                controller.release(Key.esc)
                 
-                # Create keyboard controller and send ESC key
-                keyboard_controller = Controller()
-                keyboard_controller.press(Key.esc)
-                keyboard_controller.release(Key.esc)
-                
-            except ImportError:
-                # Fallback to direct stop if pynput not available
-                self.recorder.stop_recording()
             except Exception as e:
                 # Fallback to direct stop if any error occurs
                 print(f"Error simulating ESC key: {e}")
@@ -145,10 +302,8 @@ class RecorderThread(QThread):
 class ReplayThread(QThread):
     """Thread for handling mouse replay"""
     replay_started = pyqtSignal()
-    replay_progress = pyqtSignal(int)  # percentage
     replay_finished = pyqtSignal()
     replay_error = pyqtSignal(str)
-    replay_count_update = pyqtSignal(int, int)  # current, total
     
     def __init__(self, recording_file, speed=1.0, delay_start=3,
                  replay_times=1, replay_hours=0.0, replay_latency=2.0):
@@ -160,8 +315,21 @@ class ReplayThread(QThread):
         self.replay_hours = float(replay_hours)  # Hours for time-based replay
         self.replay_latency = float(replay_latency)  # Pause between replays
         self.replayer = None
+        # Written by the replay loop and polled by the GUI timer, plain
+        # attribute stores are atomic so no signal or lock is needed
+        self.progress = 0  # percentage
+        self.replay_count = (0, 0)  # current, total (-1 for time-based)
+        # Checked by the replay loops instead of the mutex-guarded
+        # isRunning(), and waited on so that sleeps end as soon as it is set
+        self._stop_event = threading.Event()
+        
+    def request_stop(self):
+        """Ask the replay loops to stop at the next event"""
+        self._stop_event.set()
         
     def run(self):
+        # The countdown runs while the recording is loaded and planned
+        countdown_end = time.perf_counter() + self.delay_start
         try:
             self.replayer = MouseReplayer(self.recording_file)
             if not self.replayer.load_recording():
@@ -180,113 +348,144 @@ class ReplayThread(QThread):
                 self.replay_error.emit("No recording data available")
                 return
                 
-            events = self.replayer.recording_data['events']
-            if not events:
+            if not self.replayer.timestamps:
                 self.replay_error.emit("No events to replay")
                 return
             
-            # Countdown delay
-            for i in range(self.delay_start, 0, -1):
-                time.sleep(1)
+            self.replayer.coalesce_moves()
+            
+            # Wait out what is left of the countdown
+            remaining = countdown_end - time.perf_counter()
+            self._stop_event.wait(max(0.0, remaining))
             
             # Time-based or count-based replay
             if self.replay_hours > 0:
-                self._time_based_replay(events)
+                self._time_based_replay()
             else:
-                self._count_based_replay(events)
+                self._count_based_replay()
                 
             self.replay_finished.emit()
             
         except Exception as e:
             self.replay_error.emit(str(e))
     
-    def _time_based_replay(self, events):
+    def _time_based_replay(self):
         """Execute time-based replay for specified hours"""
-        end_time = time.time() + (self.replay_hours * 3600)
+        target_times = self.replayer.scaled_timestamps(self.speed)
+        execute = self.replayer._run_step
+        skip_due_moves = self.replayer.skip_due_moves
+        plan = self.replayer.call_plan()
+        n_events = len(plan)
+        now = time.perf_counter
+        sleep = MouseReplayer.precise_sleep
+        stop_event = self._stop_event
+        total_time = self.replay_hours * 3600.0
+        percent_per_second = 100.0 / total_time
+        replay_start_wall = now()
+        end_time = replay_start_wall + total_time
         replay_count = 0
         
-        while time.time() < end_time and self.isRunning():
+        # Recording duration is constant across replays
+        metadata = self.replayer.recording_data['metadata']
+        recording_duration = metadata['duration'] / self.speed
+        
+        while now() < end_time and not stop_event.is_set():
             replay_count += 1
-            remaining_time = end_time - time.time()
+            remaining_time = end_time - now()
             
             # -1 indicates time-based replay mode
-            self.replay_count_update.emit(replay_count, -1)
+            self.replay_count = (replay_count, -1)
             
             # Check if we have enough time for complete replay
-            metadata = self.replayer.recording_data['metadata']
-            recording_duration = metadata['duration'] / self.speed
             if remaining_time < recording_duration:
                 break
             
-            # Execute single replay
-            start_time = time.time()
-            for i, event in enumerate(events):
-                if not self.isRunning() or time.time() >= end_time:
+            # Execute single replay, paced from its own start time
+            deadlines = MouseReplayer.deadlines(target_times, now())
+            self.replayer.reset_position()
+            i = 0
+            while i < n_events:
+                if stop_event.is_set() or now() >= end_time:
                     return
                     
-                # Calculate delay based on timestamp and replay speed
-                target_time = event['timestamp'] / self.speed
-                current_elapsed = time.time() - start_time
-                delay = target_time - current_elapsed
+                delay = deadlines[i] - now()
                 
                 if delay > 0:
-                    time.sleep(delay)
+                    if sleep(delay, stop_event):
+                        return
+                else:
+                    # Behind schedule, jump to the latest overdue move
+                    i = skip_due_moves(i, deadlines, now())
                     
-                self.replayer._execute_event(event)
+                execute(*plan[i])
+                i += 1
                 
                 # Update progress based on time remaining
-                start_time = end_time - self.replay_hours * 3600
-                elapsed_time = time.time() - start_time
-                total_time = self.replay_hours * 3600
-                time_progress = int((elapsed_time / total_time) * 100)
-                self.replay_progress.emit(min(time_progress, 100))
+                elapsed_time = now() - replay_start_wall
+                self.progress = min(int(elapsed_time * percent_per_second),
+                                    100)
             
             # Configurable pause between replays
-            if time.time() < end_time and self.isRunning():
+            if now() < end_time and not stop_event.is_set():
                 if self.replay_latency > 0:
-                    time.sleep(self.replay_latency)
+                    stop_event.wait(self.replay_latency)
     
-    def _count_based_replay(self, events):
+    def _count_based_replay(self):
         """Execute count-based replay for specified number of times"""
+        target_times = self.replayer.scaled_timestamps(self.speed)
+        execute = self.replayer._run_step
+        skip_due_moves = self.replayer.skip_due_moves
+        plan = self.replayer.call_plan()
+        n_events = len(plan)
+        now = time.perf_counter
+        sleep = MouseReplayer.precise_sleep
+        stop_event = self._stop_event
+        replay_times = self.replay_times
+        
         # Multiple replay loop
-        for replay_num in range(self.replay_times):
-            if not self.isRunning():  # Check if thread should stop
+        for replay_num in range(replay_times):
+            if stop_event.is_set():  # Check if thread should stop
                 break
             
-            self.replay_count_update.emit(replay_num + 1, self.replay_times)
+            self.replay_count = (replay_num + 1, replay_times)
+            # Progress points of the completed passes, out of 100 each
+            pass_base = replay_num * 100
             
-            start_time = time.time()
+            deadlines = MouseReplayer.deadlines(target_times, now())
+            self.replayer.reset_position()
             
-            for i, event in enumerate(events):
-                if not self.isRunning():  # Check if thread should stop
+            i = 0
+            while i < n_events:
+                if stop_event.is_set():  # Check if thread should stop
                     break
                     
-                # Calculate delay based on timestamp and replay speed
-                target_time = event['timestamp'] / self.speed
-                current_elapsed = time.time() - start_time
-                delay = target_time - current_elapsed
+                delay = deadlines[i] - now()
                 
                 if delay > 0:
-                    time.sleep(delay)
+                    if sleep(delay, stop_event):
+                        return
+                else:
+                    # Behind schedule, jump to the latest overdue move
+                    i = skip_due_moves(i, deadlines, now())
                     
-                self.replayer._execute_event(event)
+                execute(*plan[i])
                 
-                # Update progress for current replay
-                event_progress = int((i / len(events)) * 100)
-                # Calculate overall progress across all replays
-                overall_progress = int(
-                    ((replay_num * 100) + event_progress) / self.replay_times
-                )
-                self.replay_progress.emit(overall_progress)
+                # Update overall progress across all replays
+                self.progress = (
+                    pass_base + (i * 100) // n_events
+                ) // replay_times
+                i += 1
             
             # Add configurable pause between replays (except for last one)
-            if replay_num < self.replay_times - 1 and self.isRunning():
+            if replay_num < replay_times - 1 and not stop_event.is_set():
                 if self.replay_latency > 0:
-                    time.sleep(self.replay_latency)
+                    stop_event.wait(self.replay_latency)
 
 
 class MouseRecorderGUI(QMainWindow):
     """Main GUI application for mouse recording and replay"""
+    # panel label attribute, filename, info text
+    file_info_ready = pyqtSignal(str, str, str)
     
     def __init__(self):
         super().__init__()
@@ -294,10 +493,53 @@ class MouseRecorderGUI(QMainWindow):
         self.replay_thread = None
         self.current_recording_file = "data/mouse_recording.json"
         
+        # Recordings are written here so the recorder thread can report
+        # the stop right away; a single worker keeps saves in order
+        self.save_executor = ThreadPoolExecutor(max_workers=1)
+        # File info panels stat and parse recordings here, off the GUI
+        # thread
+        self.info_executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Replay progress is polled from the replay thread instead of
+        # being pushed per event through queued signals
+        self.replay_poll_timer = QTimer(self)
+        self.replay_poll_timer.setInterval(REPLAY_POLL_INTERVAL_MS)
+        self.replay_poll_timer.timeout.connect(self.poll_replay_status)
+        
+        # File info refreshes wait until typing in a path field pauses
+        self.pending_replay_file = ""
+        # Latest filename requested per panel, older results are dropped
+        self.requested_file_info = {}
+        # Latest file info future per panel, cancelled on close
+        self.file_info_futures = {}
+        self.file_info_ready.connect(self.on_file_info_ready)
+        self.file_info_timer = self.create_debounce_timer(
+            self.update_file_info
+        )
+        self.replay_file_info_timer = self.create_debounce_timer(
+            lambda: self.update_replay_file_info(self.pending_replay_file)
+        )
+        
+        # Files shown in the info panels are refreshed when they change on
+        # disk, through the same debounce as typing in the path fields
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(self.on_watched_file_changed)
+        self.file_info_timers = {
+            "recording_info": self.file_info_timer,
+            "replay_info": self.replay_file_info_timer,
+        }
+        
         self.init_ui()
-        self.setup_connections()
         self.update_file_info()
         
+    def create_debounce_timer(self, callback):
+        """Create a single-shot timer that runs callback once restarts stop"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(FILE_INFO_DEBOUNCE_MS)
+        timer.timeout.connect(callback)
+        return timer
+        
     def safe_status_message(self, message: str):
         """Safely update status bar message"""
         status_bar = self.statusBar()
@@ -309,56 +551,6 @@ class MouseRecorderGUI(QMainWindow):
         self.setWindowTitle("Mouse Recorder & Replayer")
         self.setGeometry(100, 100, 800, 600)
         
-        # Set application icon and style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                color: white;
-                padding: 10px 20px;
-                text-align: center;
-                font-size: 14px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            .record-button {
-                background-color: #ff4444;
-            }
-            .record-button:hover {
-                background-color: #cc3333;
-            }
-            .stop-button {
-                background-color: #ff8800;
-            }
-            .stop-button:hover {
-                background-color: #cc6600;
-            }
-        """)
-        
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -368,17 +560,55 @@ class MouseRecorderGUI(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.addWidget(self.tab_widget)
         
-        # Create tabs
-        self.create_recording_tab()
-        self.create_replay_tab()
-        self.create_settings_tab()
+        # Create tab pages, their contents are built on first selection
+        self._tab_builders = (
+            self.create_recording_tab,
+            self.create_replay_tab,
+            self.create_settings_tab,
+        )
+        self._tabs_built = [False] * len(self._tab_builders)
+        for title in ("🔴 Recording", "▶️ Replay", "⚙️ Settings"):
+            self.tab_widget.addTab(QWidget(), title)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
         
         # Status bar
         self.safe_status_message("Ready")
         
-    def create_recording_tab(self):
+    def _ensure_tab_built(self, index):
+        """Build the contents of a tab page the first time it is needed"""
+        if index < 0 or self._tabs_built[index]:
+            return
+        self._tabs_built[index] = True
+        self._tab_builders[index](self.tab_widget.widget(index))
+        
+    def create_info_view(self, text, max_height):
+        """Create a read-only info display
+        
+        A plain text QLabel inside a scroll area, which is much cheaper to
+        update than a QTextEdit document.
+        
+        Returns:
+            tuple: (scroll area to add to a layout, label holding the text)
+        """
+        label = QLabel(text)
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.setAlignment(
+            Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
+        )
+        label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        label.setWordWrap(True)
+        
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setMaximumHeight(max_height)
+        scroll_area.setWidget(label)
+        return scroll_area, label
+        
+    def create_recording_tab(self, recording_widget):
         """Create the recording tab"""
-        recording_widget = QWidget()
         layout = QVBoxLayout(recording_widget)
         
         # File selection group
@@ -402,40 +632,21 @@ class MouseRecorderGUI(QMainWindow):
         # Start recording button
         self.start_record_button = QPushButton("🔴 Start Recording")
         self.start_record_button.setProperty("class", "record-button")
-        self.start_record_button.setStyleSheet("background-color: #ff4444;")
         self.start_record_button.clicked.connect(self.start_recording)
         
         # Stop recording button
         self.stop_record_button = QPushButton("⏹️ Stop Recording")
         self.stop_record_button.setProperty("class", "stop-button")
-        self.stop_record_button.setStyleSheet("background-color: #ff8800;")
         self.stop_record_button.setEnabled(False)
         self.stop_record_button.clicked.connect(self.stop_recording)
         
         # Recording status
         self.recording_status = QLabel("Status: Ready to record")
-        self.recording_status.setStyleSheet("font-size: 14px; color: #333;")
+        self.recording_status.setProperty("class", "status-label")
         
         # Recording timer container with dedicated design
         self.timer_container = QGroupBox("Recording Timer")
-        self.timer_container.setStyleSheet("""
-            QGroupBox {
-                font-size: 12px;
-                font-weight: bold;
-                color: #333;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #f8f9fa;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #666;
-            }
-        """)
+        self.timer_container.setObjectName("timerContainer")
         self.timer_container.hide()  # Initially hidden
         
         timer_layout = QVBoxLayout(self.timer_container)
@@ -444,33 +655,15 @@ class MouseRecorderGUI(QMainWindow):
         # Main timer display
         self.recording_timer = QLabel("00:00:00")
         self.recording_timer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        timer_display_style = """
-            QLabel {
-                font-family: 'Courier New', monospace;
-                font-size: 32px;
-                font-weight: bold;
-                color: #dc3545;
-                background-color: #000;
-                border: 3px solid #333;
-                border-radius: 8px;
-                padding: 10px 20px;
-                margin: 5px;
-            }
-        """
-        self.recording_timer.setStyleSheet(timer_display_style)
+        self.recording_timer.setTextFormat(Qt.TextFormat.PlainText)
+        self.recording_timer.setObjectName("recordingTimer")
         
         # Timer status label
         self.timer_status = QLabel("● RECORDING")
+        self.timer_status.setTextFormat(Qt.TextFormat.PlainText)
+        self.timer_status.setProperty("blink", "on")
         self.timer_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.timer_status.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: bold;
-                color: #dc3545;
-                background-color: transparent;
-                padding: 5px;
-            }
-        """)
+        self.timer_status.setObjectName("timerStatus")
         
         timer_layout.addWidget(self.recording_timer)
         timer_layout.addWidget(self.timer_status)
@@ -487,12 +680,11 @@ class MouseRecorderGUI(QMainWindow):
         info_group = QGroupBox("Recording Information")
         info_layout = QVBoxLayout(info_group)
         
-        self.recording_info = QTextEdit()
-        self.recording_info.setReadOnly(True)
-        self.recording_info.setMaximumHeight(150)
-        self.recording_info.setPlainText("No recording information available.")
+        info_view, self.recording_info = self.create_info_view(
+            "No recording information available.", 150
+        )
         
-        info_layout.addWidget(self.recording_info)
+        info_layout.addWidget(info_view)
         
         # Instructions group
         instructions_group = QGroupBox("Instructions")
@@ -510,7 +702,7 @@ class MouseRecorderGUI(QMainWindow):
         clicks, and scrolls
         """)
         instructions_text.setWordWrap(True)
-        instructions_text.setStyleSheet("color: #666; font-size: 12px;")
+        instructions_text.setProperty("class", "hint-label")
         
         instructions_layout.addWidget(instructions_text)
         
@@ -521,11 +713,11 @@ class MouseRecorderGUI(QMainWindow):
         layout.addWidget(instructions_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(recording_widget, "🔴 Recording")
+        # File input connection
+        self.file_input.textChanged.connect(self.on_recording_file_changed)
         
-    def create_replay_tab(self):
+    def create_replay_tab(self, replay_widget):
         """Create the replay tab"""
-        replay_widget = QWidget()
         layout = QVBoxLayout(replay_widget)
         
         # File selection group
@@ -637,13 +829,17 @@ class MouseRecorderGUI(QMainWindow):
         mode_layout = QHBoxLayout()
         mode_layout.addWidget(QLabel("Mode:"))
         
-        self.count_mode_radio = QCheckBox("Count-based (use replay times)")
-        self.time_mode_radio = QCheckBox("Time-based (use replay hours)")
+        self.count_mode_radio = QRadioButton("Count-based (use replay times)")
+        self.time_mode_radio = QRadioButton("Time-based (use replay hours)")
         self.count_mode_radio.setChecked(True)
         
-        # Connect radio buttons for exclusive selection
-        self.count_mode_radio.toggled.connect(self.on_mode_changed)
-        self.time_mode_radio.toggled.connect(self.on_mode_changed)
+        # The button group keeps the two modes mutually exclusive
+        self.mode_group = QButtonGroup(self)
+        self.mode_group.setExclusive(True)
+        self.mode_group.addButton(self.count_mode_radio)
+        self.mode_group.addButton(self.time_mode_radio)
+        self.mode_group.buttonClicked.connect(self.on_mode_changed)
+        self.on_mode_changed()
         
         mode_layout.addWidget(self.count_mode_radio)
         mode_layout.addWidget(self.time_mode_radio)
@@ -662,12 +858,11 @@ class MouseRecorderGUI(QMainWindow):
         
         # Start replay button
         self.start_replay_button = QPushButton("▶️ Start Replay")
-        self.start_replay_button.setStyleSheet("background-color: #4CAF50;")
         self.start_replay_button.clicked.connect(self.start_replay)
         
         # Stop replay button
         self.stop_replay_button = QPushButton("⏹️ Stop Replay")
-        self.stop_replay_button.setStyleSheet("background-color: #ff8800;")
+        self.stop_replay_button.setProperty("class", "stop-button")
         self.stop_replay_button.setEnabled(False)
         self.stop_replay_button.clicked.connect(self.stop_replay)
         
@@ -677,11 +872,11 @@ class MouseRecorderGUI(QMainWindow):
         
         # Replay status
         self.replay_status = QLabel("Status: Ready to replay")
-        self.replay_status.setStyleSheet("font-size: 14px; color: #333;")
+        self.replay_status.setProperty("class", "status-label")
         
         # Replay count status
         self.replay_count_status = QLabel("")
-        self.replay_count_status.setStyleSheet("font-size: 12px; color: #666;")
+        self.replay_count_status.setProperty("class", "hint-label")
         
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.start_replay_button)
@@ -696,12 +891,11 @@ class MouseRecorderGUI(QMainWindow):
         replay_info_group = QGroupBox("Replay File Information")
         replay_info_layout = QVBoxLayout(replay_info_group)
         
-        self.replay_info = QTextEdit()
-        self.replay_info.setReadOnly(True)
-        self.replay_info.setMaximumHeight(120)
-        self.replay_info.setPlainText("No file loaded.")
+        replay_info_view, self.replay_info = self.create_info_view(
+            "No file loaded.", 120
+        )
         
-        replay_info_layout.addWidget(self.replay_info)
+        replay_info_layout.addWidget(replay_info_view)
         
         # Add all groups to layout
         layout.addWidget(file_group)
@@ -710,11 +904,11 @@ class MouseRecorderGUI(QMainWindow):
         layout.addWidget(replay_info_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(replay_widget, "▶️ Replay")
+        # File input connection
+        self.replay_file_input.textChanged.connect(self.on_replay_file_changed)
         
-    def create_settings_tab(self):
+    def create_settings_tab(self, settings_widget):
         """Create the settings tab"""
-        settings_widget = QWidget()
         layout = QVBoxLayout(settings_widget)
         
         # General settings group
@@ -758,21 +952,15 @@ class MouseRecorderGUI(QMainWindow):
         layout.addWidget(about_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(settings_widget, "⚙️ Settings")
-        
-    def setup_connections(self):
-        """Setup signal connections"""
-        # File input connections
-        self.file_input.textChanged.connect(self.on_recording_file_changed)
-        self.replay_file_input.textChanged.connect(self.on_replay_file_changed)
-        
     def browse_recording_file(self):
         """Browse for recording file"""
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Save Recording As",
             self.current_recording_file,
-            "JSON files (*.json);;All files (*.*)"
+            "JSON files (*.json);;JSON Lines files (*.jsonl);;"
+            "Compressed recordings (*.json.gz *.jsonl.gz);;"
+            "All files (*.*)"
         )
         if filename:
             self.file_input.setText(filename)
@@ -784,33 +972,44 @@ class MouseRecorderGUI(QMainWindow):
             self,
             "Open Recording File",
             self.current_recording_file,
-            "JSON files (*.json);;All files (*.*)"
+            "JSON files (*.json);;JSON Lines files (*.jsonl);;"
+            "Compressed recordings (*.json.gz *.jsonl.gz);;"
+            "All files (*.*)"
         )
         if filename:
+            self.set_replay_file(filename)
+            
+    def set_replay_file(self, filename):
+        """Show a replay file chosen by the program and load its info once
+        
+        textChanged is blocked so the debounce timer does not schedule a
+        second refresh of the same file.
+        """
+        self.replay_file_info_timer.stop()
+        self.replay_file_input.blockSignals(True)
+        try:
             self.replay_file_input.setText(filename)
-            self.update_replay_file_info(filename)
+        finally:
+            self.replay_file_input.blockSignals(False)
+        self.pending_replay_file = filename
+        self.update_replay_file_info(filename)
             
     def on_recording_file_changed(self, filename):
         """Handle recording file change"""
         self.current_recording_file = filename
-        self.update_file_info()
+        self.file_info_timer.start()
         
     def on_replay_file_changed(self, filename):
         """Handle replay file change"""
-        self.update_replay_file_info(filename)
+        self.pending_replay_file = filename
+        self.replay_file_info_timer.start()
         
-    def on_mode_changed(self):
+    def on_mode_changed(self, button=None):
         """Handle mode selection change"""
-        if self.count_mode_radio.isChecked():
-            self.time_mode_radio.setChecked(False)
-            self.replay_times_spinbox.setEnabled(True)
-            self.replay_hours_spinbox.setEnabled(False)
-            self.replay_minutes_spinbox.setEnabled(False)
-        else:
-            self.count_mode_radio.setChecked(False)
-            self.replay_times_spinbox.setEnabled(False)
-            self.replay_hours_spinbox.setEnabled(True)
-            self.replay_minutes_spinbox.setEnabled(True)
+        count_mode = self.count_mode_radio.isChecked()
+        self.replay_times_spinbox.setEnabled(count_mode)
+        self.replay_hours_spinbox.setEnabled(not count_mode)
+        self.replay_minutes_spinbox.setEnabled(not count_mode)
             
     def update_speed_label(self, value):
         """Update speed label"""
@@ -819,47 +1018,58 @@ class MouseRecorderGUI(QMainWindow):
         
     def update_file_info(self):
         """Update recording file information"""
-        filename = self.current_recording_file
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                    metadata = data.get('metadata', {})
-                    
-                    info = f"""File: {filename}
-Created: {metadata.get('created_at', 'Unknown')}
-Duration: {metadata.get('duration', 0):.2f} seconds
-Events: {metadata.get('event_count', 0)}
-File Size: {os.path.getsize(filename)} bytes"""
-                    
-                    self.recording_info.setPlainText(info)
-            except Exception as e:
-                self.recording_info.setPlainText(f"Error reading file: {e}")
-        else:
-            error_msg = f"File does not exist: {filename}"
-            self.recording_info.setPlainText(error_msg)
+        self.request_file_info("recording_info", self.current_recording_file)
             
     def update_replay_file_info(self, filename):
         """Update replay file information"""
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                    metadata = data.get('metadata', {})
-                    
-                    info = f"""File: {filename}
-Created: {metadata.get('created_at', 'Unknown')}
-Duration: {metadata.get('duration', 0):.2f} seconds
-Events: {metadata.get('event_count', 0)}
-File Size: {os.path.getsize(filename)} bytes
-
-Ready to replay!"""
-                    
-                    self.replay_info.setPlainText(info)
-            except Exception as e:
-                self.replay_info.setPlainText(f"Error reading file: {e}")
-        else:
-            self.replay_info.setPlainText(f"File does not exist: {filename}")
+        self.request_file_info("replay_info", filename,
+                               "\n\nReady to replay!")
+            
+    def request_file_info(self, panel, filename, footer=""):
+        """Load a file info panel's text in the background
+        
+        Args:
+            panel (str): Attribute name of the label to fill
+            filename (str): Recording to describe
+            footer (str): Text appended when the file could be read
+        """
+        self.requested_file_info[panel] = filename
+        previous = self.file_info_futures.get(panel)
+        if previous is not None:
+            # Its text would be dropped anyway, skip it if not started
+            previous.cancel()
+        future = self.info_executor.submit(format_file_info, filename,
+                                           footer)
+        self.file_info_futures[panel] = future
+        
+        def emit_result(done):
+            if not done.cancelled():
+                self.file_info_ready.emit(panel, filename, done.result())
+        
+        future.add_done_callback(emit_result)
+        self.watch_info_files()
+        
+    def watch_info_files(self):
+        """Watch exactly the files shown in the file info panels"""
+        wanted = {name for name in self.requested_file_info.values() if name}
+        watched = set(self.file_watcher.files())
+        if watched - wanted:
+            self.file_watcher.removePaths(list(watched - wanted))
+        if wanted - watched:
+            # Paths that do not exist yet are not added, the next refresh
+            # retries them
+            self.file_watcher.addPaths(list(wanted - watched))
+            
+    def on_watched_file_changed(self, path):
+        """Schedule a refresh of the panels showing a file that changed"""
+        for panel, filename in self.requested_file_info.items():
+            if filename == path:
+                self.file_info_timers[panel].start()
+        
+    def on_file_info_ready(self, panel, filename, text):
+        """Show a loaded file info text unless a newer one was requested"""
+        if self.requested_file_info.get(panel) == filename:
+            getattr(self, panel).setText(text)
             
     def start_recording(self):
         """Start mouse recording"""
@@ -875,37 +1085,25 @@ Ready to replay!"""
         os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
         
         # Start recording thread
-        self.recorder_thread = RecorderThread(filename)
+        self.recorder_thread = RecorderThread(filename, self.save_executor)
         self.recorder_thread.recording_started.connect(
             self.on_recording_started)
         self.recorder_thread.recording_stopped.connect(
             self.on_recording_stopped)
+        self.recorder_thread.recording_saved.connect(self.on_recording_saved)
         self.recorder_thread.recording_error.connect(self.on_recording_error)
-        self.recorder_thread.timer_update.connect(self.on_timer_update)
-        self.recorder_thread.status_blink.connect(self.on_status_blink)
+        self.recorder_thread.timer_state.connect(
+            self.on_timer_state, Qt.ConnectionType.QueuedConnection
+        )
         
         self.recorder_thread.start()
         
     def stop_recording(self):
         """Stop mouse recording by simulating ESC key press"""
-        if self.recorder_thread and self.recorder_thread.recorder:
-            if self.recorder_thread.recorder.recording:
-                try:
-                    # Import pynput to simulate ESC key press
-                    from pynput.keyboard import Key, Controller
-                    
-                    # Create keyboard controller and send ESC key
-                    keyboard_controller = Controller()
-                    keyboard_controller.press(Key.esc)
-                    keyboard_controller.release(Key.esc)
-                    
-                except ImportError:
-                    # Fallback to direct thread stop if pynput not available
-                    self.recorder_thread.stop_recording()
-                except Exception as e:
-                    # Fallback to direct thread stop if any error occurs
-                    print(f"Error simulating ESC key: {e}")
-                    self.recorder_thread.stop_recording()
+        if self.recorder_thread:
+            # Sends ESC through the shared keyboard controller, with a
+            # direct stop as fallback
+            self.recorder_thread.stop_recording()
             
     def on_recording_started(self):
         """Handle recording started"""
@@ -921,18 +1119,29 @@ Ready to replay!"""
         """Handle recording stopped"""
         self.start_record_button.setEnabled(True)
         self.stop_record_button.setEnabled(False)
-        status_text = f"Status: Recording completed! ({event_count} events)"
+        status_text = f"Status: Saving recording... ({event_count} events)"
         self.recording_status.setText(status_text)
         self.timer_container.hide()  # Hide the timer container
-        self.safe_status_message(f"Recording saved: {filename}")
+        self.safe_status_message(f"Saving recording: {filename}")
         
-        # Update file info
-        self.current_recording_file = filename
-        self.update_file_info()
+    def on_recording_saved(self, filename, event_count):
+        """Handle recording written to disk"""
+        status_text = f"Status: Recording completed! ({event_count} events)"
+        self.recording_status.setText(status_text)
+        self.safe_status_message(f"Recording saved: {filename}")
         
-        # Update replay file input
-        self.replay_file_input.setText(filename)
-        self.update_replay_file_info(filename)
+        # Refresh both file panels with a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Update file info
+            self.current_recording_file = filename
+            self.update_file_info()
+            
+            # Update replay file input
+            self._ensure_tab_built(REPLAY_TAB)
+            self.set_replay_file(filename)
+        finally:
+            self.setUpdatesEnabled(True)
         
         QMessageBox.information(
             self,
@@ -955,34 +1164,33 @@ Ready to replay!"""
             f"Recording failed:\n\n{error_message}"
         )
     
+    def on_timer_state(self, state):
+        """Handle timer state from recording thread"""
+        # A newer state is already queued behind this one, skip the work
+        if self.recorder_thread and state['seq'] != self.recorder_thread.timer_seq:
+            return
+        self.on_timer_update(state['time'])
+        self.on_status_blink(state['blink'])
+    
     def on_timer_update(self, time_str):
         """Handle timer update from recording thread"""
-        self.recording_timer.setText(time_str)
+        if time_str != self.recording_timer.text():
+            self.recording_timer.setText(time_str)
     
     def on_status_blink(self, show_indicator):
         """Handle blinking recording indicator"""
-        if show_indicator:
-            self.timer_status.setText("● RECORDING")
-            self.timer_status.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #dc3545;
-                    background-color: transparent;
-                    padding: 5px;
-                }
-            """)
-        else:
-            self.timer_status.setText("○ RECORDING")
-            self.timer_status.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #6c757d;
-                    background-color: transparent;
-                    padding: 5px;
-                }
-            """)
+        blink = "on" if show_indicator else "off"
+        if self.timer_status.property("blink") == blink:
+            return
+            
+        self.timer_status.setText(
+            "● RECORDING" if show_indicator else "○ RECORDING"
+        )
+        # Restyle through the application stylesheet's [blink] selector
+        self.timer_status.setProperty("blink", blink)
+        style = self.timer_status.style()
+        style.unpolish(self.timer_status)
+        style.polish(self.timer_status)
         
     def start_replay(self):
         """Start mouse replay"""
@@ -1033,21 +1241,19 @@ Ready to replay!"""
                                           replay_times, replay_hours,
                                           replay_latency)
         self.replay_thread.replay_started.connect(self.on_replay_started)
-        self.replay_thread.replay_progress.connect(self.on_replay_progress)
         self.replay_thread.replay_finished.connect(self.on_replay_finished)
         self.replay_thread.replay_error.connect(self.on_replay_error)
-        self.replay_thread.replay_count_update.connect(
-            self.on_replay_count_update
-        )
         
         self.replay_thread.start()
         
     def stop_replay(self):
         """Stop mouse replay"""
         if self.replay_thread and self.replay_thread.isRunning():
-            self.replay_thread.terminate()
-            self.replay_thread.wait()
-            self.on_replay_finished()
+            # The loops see the stop event by the next event or sleep; the
+            # UI is reset by the replay_finished signal once they have
+            self.replay_thread.request_stop()
+            self.stop_replay_button.setEnabled(False)
+            self.replay_status.setText("Status: Stopping replay...")
             
     def on_replay_started(self):
         """Handle replay started"""
@@ -1057,6 +1263,14 @@ Ready to replay!"""
         self.replay_progress_bar.setValue(0)
         self.replay_status.setText("Status: Replaying...")
         self.safe_status_message("Replay in progress...")
+        self.replay_poll_timer.start()
+        
+    def poll_replay_status(self):
+        """Show the progress and replay count published by the thread"""
+        if self.replay_thread is None:
+            return
+        self.on_replay_progress(self.replay_thread.progress)
+        self.on_replay_count_update(*self.replay_thread.replay_count)
         
     def on_replay_progress(self, percentage):
         """Handle replay progress update"""
@@ -1073,6 +1287,7 @@ Ready to replay!"""
         
     def on_replay_finished(self):
         """Handle replay finished"""
+        self.replay_poll_timer.stop()
         self.start_replay_button.setEnabled(True)
         self.stop_replay_button.setEnabled(False)
         self.replay_progress_bar.setVisible(False)
@@ -1082,6 +1297,7 @@ Ready to replay!"""
         
     def on_replay_error(self, error_message):
         """Handle replay error"""
+        self.replay_poll_timer.stop()
         self.start_replay_button.setEnabled(True)
         self.stop_replay_button.setEnabled(False)
         self.replay_progress_bar.setVisible(False)
@@ -1092,16 +1308,40 @@ Ready to replay!"""
             self, "Replay Error", f"Replay failed:\n\n{error_message}"
         )
         
+    def wait_for_thread(self, thread):
+        """Wait for a thread that was asked to stop to finish
+        
+        Gives up after two THREAD_STOP_TIMEOUT_MS waits so that closing
+        the window never hangs on a thread that does not stop.
+        """
+        if thread.wait(THREAD_STOP_TIMEOUT_MS):
+            return
+        print("Waiting for a background thread to finish...")
+        if not thread.wait(THREAD_STOP_TIMEOUT_MS):
+            print("Background thread did not stop, closing anyway")
+            
     def closeEvent(self, event):
         """Handle application close"""
-        # Stop any running threads
+        # Stop any running threads cooperatively. They are never
+        # terminated, which could leave pynput's input hooks installed
         if self.recorder_thread and self.recorder_thread.isRunning():
-            self.recorder_thread.terminate()
-            self.recorder_thread.wait()
+            # Ends the recorder's stop key wait directly, a simulated ESC
+            # could be missed by the keyboard hook
+            recorder = self.recorder_thread.recorder
+            if recorder is not None:
+                recorder.stop_requested.set()
+            self.wait_for_thread(self.recorder_thread)
             
         if self.replay_thread and self.replay_thread.isRunning():
-            self.replay_thread.terminate()
-            self.replay_thread.wait()
+            self.replay_thread.request_stop()
+            self.wait_for_thread(self.replay_thread)
+            
+        # Let a recording that is still being written finish
+        self.save_executor.shutdown(wait=True)
+        # shutdown(cancel_futures=True) needs Python 3.9
+        for future in self.file_info_futures.values():
+            future.cancel()
+        self.info_executor.shutdown(wait=False)
             
         event.accept()
 
@@ -1111,6 +1351,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Mouse Recorder & Replayer")
     app.setApplicationVersion("1.0.0")
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Create and show main window
     window = MouseRecorderGUI()
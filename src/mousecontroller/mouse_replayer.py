@@ -3,45 +3,835 @@
 Mouse Replayer - Replays recorded mouse movements, clicks, and scroll actions
 """
 
+import functools
+import gzip
 import json
+import mmap
 import time
+from array import array
+from bisect import bisect_right
 import sys
 import os
+import atexit
 from pynput.mouse import Button, Listener
 from pynput import mouse
 
+try:
+    import orjson
+except ImportError:  # Optional dependency, fall back to the stdlib parser
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # Optional dependency, metadata reads parse the file
+    ijson = None
+
+# Recordings written as JSON Lines: a metadata header line followed by
+# one event per line (see MouseRecorder)
+JSONL_EXTENSION = ".jsonl"
+
+# Recordings gzip compressed by MouseRecorder carry this suffix after
+# their extension
+GZIP_SUFFIX = ".gz"
+
+# Sidecar file next to a JSON recording caching its metadata block, valid
+# while the recording's mtime and size are unchanged
+METADATA_SIDECAR_SUFFIX = ".meta.json"
+
+# Event types as small integer codes, used to index the dispatch table
+TYPE_MOVE, TYPE_CLICK, TYPE_SCROLL = 0, 1, 2
+TYPE_NAMES = ('move', 'click', 'scroll')
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+TYPE_UNKNOWN = -1
+
+# Recorded button names to pynput buttons, anything else replays as right
+_BUTTON_MAP = {
+    'left': Button.left,
+    'right': Button.right,
+    'middle': Button.middle,
+}
+
+# time.sleep can overshoot by a scheduler tick (up to ~16ms on Windows),
+# so the last stretch of a precise sleep is spent spinning instead
+SPIN_THRESHOLD = 0.002
+
+# Longest single sleep of the pre-replay countdown
+COUNTDOWN_STEP = 0.1
+
+# Minimum time in seconds between two console progress updates
+PROGRESS_INTERVAL = 0.1
+
+# Runs of moves closer together than one 60 Hz frame are replayed as a
+# single move per frame, the OS only shows the last position anyway
+MOVE_COALESCE_WINDOW = 0.016
+
+# Binary copy of a loaded recording's columns, stored next to recordings
+# of at least COLUMN_CACHE_MIN_SIZE bytes and valid while the recording's
+# mtime and size are unchanged. It holds a JSON header line followed by the
+# raw bytes of each column in _COLUMN_LAYOUT order.
+COLUMN_CACHE_SUFFIX = ".cols"
+COLUMN_CACHE_MIN_SIZE = 1024 * 1024
+_COLUMN_LAYOUT = (
+    ('type_index', 'h'), ('xs', 'd'), ('ys', 'd'), ('timestamps', 'd'),
+    ('button_index', 'h'), ('pressed', 'b'), ('dxs', 'd'), ('dys', 'd'),
+)
+
+# MouseRecorder writes the metadata block first, so it normally fits in
+# this many leading bytes of a JSON recording
+METADATA_PREFIX_SIZE = 64 * 1024
+
+# JSON recordings at least this large are parsed straight from a read-only
+# memory map when orjson is installed; below it the mapping setup costs
+# more than the copy it saves
+MMAP_MIN_SIZE = 64 * 1024
+
+# Columns and metadata of recordings below COLUMN_CACHE_MIN_SIZE kept per
+# process, keyed on path, mtime and size, so replaying the same small file
+# again (e.g. from the GUI) skips the parser. Larger files use the column
+# cache file instead. Each load gets its own copies of the cached values.
+PARSED_CACHE_SIZE = 8
+
+# Recordings larger than this (in bytes) are replayed while they are read
+# instead of being loaded into memory first
+STREAMING_THRESHOLD = 50 * 1024 * 1024
+
+# Read size for streamed recordings, large enough that line iteration and
+# ijson refills do few system calls
+STREAM_BUFFER_SIZE = 1 << 20
+
+
+_timer_resolution_raised = False
+
+
+def _raise_timer_resolution():
+    """Lower the Windows scheduler tick to 1 ms for the rest of the process
+    
+    time.sleep on Windows otherwise wakes up in ~15.6 ms steps. Only done
+    once, and undone at exit; a no-op on other platforms.
+    """
+    global _timer_resolution_raised
+    if _timer_resolution_raised or sys.platform != 'win32':
+        return
+    _timer_resolution_raised = True
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        if winmm.timeBeginPeriod(1) == 0:
+            atexit.register(winmm.timeEndPeriod, 1)
+    except (ImportError, AttributeError, OSError):
+        pass
+
+
+def _native_cursor_setter():
+    """Return a direct SetCursorPos(x, y) binding on Windows, else None
+    
+    pynput's position setter wraps the same call in property and
+    notification machinery; on other platforms pynput is used as is.
+    """
+    if sys.platform != 'win32':
+        return None
+    try:
+        import ctypes
+        set_cursor_pos = ctypes.windll.user32.SetCursorPos
+    except (ImportError, AttributeError, OSError):
+        return None
+    return lambda x, y: set_cursor_pos(int(x), int(y))
+
+
+def _loads(data):
+    """Decode a JSON document, preferring orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """Encode an object as compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _map_file(fh):
+    """Return a read-only memory map of an opened file, or None
+    
+    None is returned for files that cannot be mapped (pipes, stdin) and
+    for files smaller than MMAP_MIN_SIZE.
+    """
+    try:
+        if os.fstat(fh.fileno()).st_size < MMAP_MIN_SIZE:
+            return None
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def _parse_handle(fh, filename):
+    """Parse an opened JSON or JSON Lines recording
+    
+    Returns:
+        tuple: (size of the file in bytes, parsed document dict)
+    """
+    mapped = None
+    if (orjson is not None and not _is_jsonl(filename) and
+            not filename.endswith(GZIP_SUFFIX)):
+        mapped = _map_file(fh)
+    if mapped is not None:
+        # orjson parses the mapped pages without copying them into a
+        # bytes object first
+        with mapped, memoryview(mapped) as view:
+            return len(view), orjson.loads(view)
+    data = fh.read()
+    file_size = len(data)
+    if filename.endswith(GZIP_SUFFIX):
+        data = gzip.decompress(data)
+    if _is_jsonl(filename):
+        return file_size, _parse_jsonl(data)
+    return file_size, _loads(data)
+
+
+def _event_columns(events):
+    """Build the replay columns of a list of event dicts
+    
+    Returns:
+        dict: Column name to list or array, one entry per event
+    """
+    types = [event.get('type', 'unknown') for event in events]
+    return {
+        'types': types,
+        'type_codes': array(
+            'b', [TYPE_CODES.get(t, TYPE_UNKNOWN) for t in types]
+        ),
+        'xs': array('d', [event.get('x', 0) for event in events]),
+        'ys': array('d', [event.get('y', 0) for event in events]),
+        'timestamps': array(
+            'd', [event.get('timestamp', 0.0) for event in events]
+        ),
+        'buttons': [event.get('button') for event in events],
+        'pressed': array(
+            'b', [bool(event.get('pressed')) for event in events]
+        ),
+        'dxs': array('d', [event.get('dx', 0) for event in events]),
+        'dys': array('d', [event.get('dy', 0) for event in events]),
+    }
+
+
+@functools.lru_cache(maxsize=PARSED_CACHE_SIZE)
+def _load_small_recording(filename, st_mtime_ns, st_size):
+    """Parse a recording into (file size, metadata, columns), cached
+    
+    st_mtime_ns and st_size are only part of the cache key, a changed
+    file gets a new entry instead of the stale one. The parsed event
+    dicts are dropped once the columns are built. Callers must copy the
+    returned values before using them.
+    """
+    with open(filename, 'rb') as fh:
+        file_size, document = _parse_handle(fh, filename)
+    return (file_size, document.get('metadata', {}),
+            _event_columns(document.get('events', [])))
+
+
+def _metadata_from_prefix(prefix):
+    """Decode the metadata block from the first bytes of a JSON recording
+    
+    Returns None unless "metadata" is the document's first key and its
+    object is complete within the prefix.
+    """
+    text = prefix.decode('utf-8', errors='ignore')
+    key = text.find('"metadata"')
+    if key < 0 or text[:key].strip() != '{':
+        return None
+    colon = text.find(':', key + len('"metadata"'))
+    if colon < 0:
+        return None
+    start = len(text) - len(text[colon + 1:].lstrip())
+    try:
+        metadata, _ = json.JSONDecoder().raw_decode(text, start)
+    except ValueError:
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+def _read_metadata_sidecar(filename, st):
+    """Return the cached metadata of a recording, or None if stale/missing"""
+    try:
+        with open(filename + METADATA_SIDECAR_SUFFIX, 'rb') as f:
+            cached = _loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if (cached.get('st_mtime_ns') != st.st_mtime_ns or
+            cached.get('st_size') != st.st_size):
+        return None
+    return cached.get('metadata')
+
+
+def _write_metadata_sidecar(filename, st, metadata):
+    """Cache the metadata of a recording, ignoring unwritable locations"""
+    try:
+        with open(filename + METADATA_SIDECAR_SUFFIX, 'wb') as f:
+            f.write(_dumps({
+                'st_mtime_ns': st.st_mtime_ns,
+                'st_size': st.st_size,
+                'metadata': metadata,
+            }))
+    except (OSError, TypeError):
+        pass
+
+
+def _is_jsonl(filename):
+    """Check whether a recording file name is JSON Lines, compressed or not"""
+    if filename.endswith(GZIP_SUFFIX):
+        filename = filename[:-len(GZIP_SUFFIX)]
+    return filename.endswith(JSONL_EXTENSION)
+
+
+def _open_recording(filename, buffering=-1):
+    """Open a recording for binary reading, decompressing gzip files"""
+    if filename.endswith(GZIP_SUFFIX):
+        return gzip.open(filename, 'rb')
+    return open(filename, 'rb', buffering=buffering)
+
+
+def _iter_file_events(filename):
+    """Yield the events of a recording file one at a time"""
+    with _open_recording(filename, STREAM_BUFFER_SIZE) as f:
+        if _is_jsonl(filename):
+            f.readline()  # Metadata header
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+        elif ijson is not None:
+            yield from ijson.items(f, 'events.item', use_float=True,
+                                   buf_size=STREAM_BUFFER_SIZE)
+        else:
+            yield from _loads(f.read()).get('events', [])
+
+
+def _complete_metadata(filename, metadata):
+    """Fill in the event count and duration a metadata block lacks
+    
+    Both come from one streaming pass over the events, the duration being
+    the last event's timestamp.
+    """
+    if 'event_count' in metadata and 'duration' in metadata:
+        return metadata
+    count = 0
+    last = 0.0
+    for event in _iter_file_events(filename):
+        count += 1
+        last = event.get('timestamp', last)
+    metadata = dict(metadata)
+    metadata.setdefault('event_count', count)
+    metadata.setdefault('duration', last)
+    return metadata
+
+
+def _number(value):
+    """Return a float column value as int when it holds a whole number"""
+    return int(value) if value.is_integer() else value
+
+
+def _parse_jsonl(data):
+    """Parse a JSON Lines recording into the regular recording layout"""
+    lines = data.splitlines()
+    metadata = _loads(lines[0]).get("metadata", {}) if lines else {}
+    events = [_loads(line) for line in lines[1:] if line.strip()]
+    return {"metadata": metadata, "events": events}
+
 
 class MouseReplayer:
     def __init__(self, recording_file="data/mouse_recording.json"):
         self.recording_file = recording_file
         self.controller = mouse.Controller()
         self.recording_data = None
+        self.file_size = 0  # Size in bytes of the last loaded file
+        # Columnar view of the loaded events, one entry per event
+        self.types = []
+        self.type_codes = array('b')
+        self.xs = array('d')
+        self.ys = array('d')
+        self.timestamps = array('d')
+        self.buttons = []
+        self.pressed = array('b')
+        self.dxs = array('d')
+        self.dys = array('d')
+        self.moves_coalesced = False
+        self._schedule = None  # (speed, target_times, plan) of the columns
         self.replay_speed = 1.0  # Normal speed
         self.replay_times = 1  # Default replay count
         self.replay_hours = 0  # Default replay hours (0 = disabled)
         self.replay_latency = 2.0  # Default latency between replays in seconds
+        self.coalesce_window = MOVE_COALESCE_WINDOW  # Seconds, 0 = disabled
+        # Progress lines rewrite themselves with '\r', useless in a log
+        self._progress_enabled = (sys.stdout is not None and
+                                  sys.stdout.isatty())
+        # Last cursor position set by a replay, None when unknown
+        self._last_pos = None
+        self._set_cursor = (_native_cursor_setter() or
+                            self._set_cursor_pynput)
         
     def load_recording(self, filename=None):
         """Load recording from JSON file"""
         file_to_load = filename or self.recording_file
         
         try:
-            with open(file_to_load, 'r') as f:
-                self.recording_data = json.load(f)
-                print(f"Loaded recording: {file_to_load}")
-                print(f"Duration: {self.recording_data['metadata']['duration']:.2f} seconds")
-                print(f"Events: {self.recording_data['metadata']['event_count']}")
-                return True
+            f = open(file_to_load, 'rb')
         except FileNotFoundError:
             print(f"Recording file not found: {file_to_load}")
             return False
+        except OSError as e:
+            print(f"Error loading recording: {e}")
+            return False
+            
+        with f:
+            st = os.fstat(f.fileno())
+            use_cache = st.st_size >= COLUMN_CACHE_MIN_SIZE
+            if use_cache and self._load_column_cache(file_to_load, st):
+                self._report_loaded(file_to_load)
+                return True
+            if self.wants_streaming(f):
+                loaded = None
+            else:
+                loaded = self.load_from_handle(f, st)
+        if loaded is None:
+            loaded = self.load_recording_streaming(file_to_load)
+        if loaded and use_cache:
+            self._save_column_cache(file_to_load, st)
+        return loaded
+
+    def _report_loaded(self, file_to_load):
+        """Print a short summary of the loaded recording"""
+        metadata = self.recording_data['metadata']
+        print(f"Loaded recording: {file_to_load}")
+        print(f"Duration: {metadata['duration']:.2f} seconds")
+        print(f"Events: {metadata['event_count']}")
+
+    def _save_column_cache(self, filename, st):
+        """Write the loaded columns to the recording's column cache"""
+        type_names = list(dict.fromkeys(self.types))
+        button_names = list(dict.fromkeys(self.buttons))
+        type_lookup = {name: i for i, name in enumerate(type_names)}
+        button_lookup = {name: i for i, name in enumerate(button_names)}
+        columns = {
+            'type_index': array('h', [type_lookup[t] for t in self.types]),
+            'button_index': array(
+                'h', [button_lookup[b] for b in self.buttons]
+            ),
+            'xs': self.xs, 'ys': self.ys, 'timestamps': self.timestamps,
+            'pressed': self.pressed, 'dxs': self.dxs, 'dys': self.dys,
+        }
+        header = {
+            'byteorder': sys.byteorder,
+            'st_mtime_ns': st.st_mtime_ns,
+            'st_size': st.st_size,
+            'count': len(self.types),
+            'metadata': self.recording_data.get('metadata', {}),
+            'type_names': type_names,
+            'button_names': button_names,
+        }
+        try:
+            with open(filename + COLUMN_CACHE_SUFFIX, 'wb') as f:
+                f.write(_dumps(header) + b'\n')
+                for name, _ in _COLUMN_LAYOUT:
+                    f.write(columns[name].tobytes())
+        except (OSError, TypeError, OverflowError):
+            pass
+
+    def _load_column_cache(self, filename, st):
+        """Fill the columns from the recording's column cache
+        
+        Returns:
+            bool: False if there is no valid cache for this file version
+        """
+        try:
+            with open(filename + COLUMN_CACHE_SUFFIX, 'rb') as f:
+                header = _loads(f.readline())
+                # Column slices of the view are not copied before
+                # frombytes copies them into the arrays
+                data = memoryview(f.read())
+        except (OSError, ValueError):
+            return False
+        if (header.get('byteorder') != sys.byteorder or
+                header.get('st_mtime_ns') != st.st_mtime_ns or
+                header.get('st_size') != st.st_size):
+            return False
+            
+        count = header['count']
+        columns = {}
+        offset = 0
+        for name, typecode in _COLUMN_LAYOUT:
+            column = array(typecode)
+            end = offset + count * column.itemsize
+            column.frombytes(data[offset:end])
+            if len(column) != count:
+                return False
+            columns[name] = column
+            offset = end
+            
+        type_names = header['type_names']
+        button_names = header['button_names']
+        self.types = [type_names[i] for i in columns['type_index']]
+        self.type_codes = array(
+            'b', [TYPE_CODES.get(t, TYPE_UNKNOWN) for t in self.types]
+        )
+        self.buttons = [button_names[i] for i in columns['button_index']]
+        self.xs = columns['xs']
+        self.ys = columns['ys']
+        self.timestamps = columns['timestamps']
+        self.pressed = columns['pressed']
+        self.dxs = columns['dxs']
+        self.dys = columns['dys']
+        self.moves_coalesced = False
+        self._schedule = None
+        self.file_size = st.st_size
+        self.recording_data = {'metadata': header['metadata']}
+        return True
+
+    def load_recording_streaming(self, filename=None):
+        """Load a recording into the columns without keeping its events
+        
+        Events are parsed one at a time and appended to the columns, so
+        neither the file contents nor the list of event dicts is held in
+        memory. Like every load, recording_data only carries the metadata;
+        the events property rebuilds event dicts from the columns.
+        
+        Args:
+            filename (str): Recording to load, defaults to recording_file
+        
+        Returns:
+            bool: True if the recording was loaded
+        """
+        file_to_load = filename or self.recording_file
+        
+        try:
+            metadata = self.load_metadata(file_to_load)
+            self._build_columns([])
+            self._append_columns(self.iter_events(file_to_load))
+            self.file_size = os.path.getsize(file_to_load)
+            self.recording_data = {'metadata': metadata}
+            self._report_loaded(file_to_load)
+            return True
+        except Exception as e:
+            print(f"Error loading recording: {e}")
+            return False
+
+    def load_from_handle(self, fh, st=None):
+        """Load recording from an already opened file
+        
+        Args:
+            fh: File object opened for reading, the caller closes it
+            st: os.stat_result of the file; when given for a file below
+                COLUMN_CACHE_MIN_SIZE, the columns of an earlier load of
+                the same version are reused
+        
+        Returns:
+            bool: True if the recording was loaded
+        """
+        file_to_load = str(getattr(fh, 'name', self.recording_file))
+        
+        try:
+            if st is not None and st.st_size < COLUMN_CACHE_MIN_SIZE:
+                file_size, metadata, columns = _load_small_recording(
+                    os.path.abspath(file_to_load), st.st_mtime_ns, st.st_size
+                )
+                # Copies, so no two replayers share a mutable value
+                metadata = dict(metadata)
+                columns = {name: column[:]
+                           for name, column in columns.items()}
+            else:
+                file_size, document = _parse_handle(fh, file_to_load)
+                metadata = document.get('metadata', {})
+                columns = _event_columns(document.get('events', []))
+            self.file_size = file_size
+            # The event dicts only feed the columns, recording_data holds
+            # just the metadata whichever way a recording is loaded
+            self.recording_data = {'metadata': metadata}
+            self._set_columns(columns)
+            self._report_loaded(file_to_load)
+            return True
         except json.JSONDecodeError:
             print(f"Invalid JSON format in file: {file_to_load}")
             return False
         except Exception as e:
             print(f"Error loading recording: {e}")
             return False
+
+    def _build_columns(self, events):
+        """Store event types, positions and timestamps as parallel columns"""
+        self._set_columns(_event_columns(events))
+
+    def _set_columns(self, columns):
+        """Replace the columns with the ones built by _event_columns"""
+        for name, column in columns.items():
+            setattr(self, name, column)
+        self.moves_coalesced = False
+        self._schedule = None
+
+    def _append_columns(self, events):
+        """Append events from an iterable to the columns in a single pass"""
+        add_type = self.types.append
+        add_code = self.type_codes.append
+        add_x = self.xs.append
+        add_y = self.ys.append
+        add_timestamp = self.timestamps.append
+        add_button = self.buttons.append
+        add_pressed = self.pressed.append
+        add_dx = self.dxs.append
+        add_dy = self.dys.append
+        for event in events:
+            event_type = event.get('type', 'unknown')
+            add_type(event_type)
+            add_code(TYPE_CODES.get(event_type, TYPE_UNKNOWN))
+            add_x(event.get('x', 0))
+            add_y(event.get('y', 0))
+            add_timestamp(event.get('timestamp', 0.0))
+            add_button(event.get('button'))
+            add_pressed(bool(event.get('pressed')))
+            add_dx(event.get('dx', 0))
+            add_dy(event.get('dy', 0))
+
+    @property
+    def events(self):
+        """The loaded events as dicts, rebuilt from the columns
+        
+        recording_data does not keep the event list; this builds it on
+        each access in the same shape MouseRecorder saves.
+        """
+        events = []
+        add = events.append
+        for event_type, x, y, timestamp, button, pressed, dx, dy in zip(
+                self.types, self.xs, self.ys, self.timestamps, self.buttons,
+                self.pressed, self.dxs, self.dys):
+            event = {"type": event_type, "x": _number(x), "y": _number(y)}
+            if event_type == 'click':
+                event["button"] = button
+                event["pressed"] = bool(pressed)
+            elif event_type == 'scroll':
+                event["dx"] = _number(dx)
+                event["dy"] = _number(dy)
+            event["timestamp"] = timestamp
+            add(event)
+        return events
+
+    def coalesce_moves(self, window=None):
+        """Drop moves the cursor would not visibly reach before the next one
+        
+        A move is dropped when it falls within the window of the last kept
+        event and the following event is also a move, so each run of moves
+        keeps about one position per frame plus its final position.
+        Clicks and scrolls are always kept. The columns are filtered in
+        place, so the events property reflects the coalesced moves.
+        
+        Args:
+            window (float): Coalescing window in recorded seconds,
+                defaults to coalesce_window
+        
+        Returns:
+            int: Number of moves dropped
+        """
+        if window is None:
+            window = self.coalesce_window
+        if self.moves_coalesced or window <= 0:
+            return 0
+        self.moves_coalesced = True
+        
+        codes = self.type_codes
+        timestamps = self.timestamps
+        last = len(codes) - 1
+        keep = []
+        anchor = float('-inf')
+        for i, code in enumerate(codes):
+            if (code == TYPE_MOVE and i < last and
+                    codes[i + 1] == TYPE_MOVE and
+                    timestamps[i] - anchor < window):
+                continue
+            keep.append(i)
+            anchor = timestamps[i]
+            
+        dropped = len(codes) - len(keep)
+        if dropped:
+            self._schedule = None
+            for name in ('types', 'type_codes', 'xs', 'ys', 'timestamps',
+                         'buttons', 'pressed', 'dxs', 'dys'):
+                column = getattr(self, name)
+                selected = [column[i] for i in keep]
+                if isinstance(column, array):
+                    selected = array(column.typecode, selected)
+                setattr(self, name, selected)
+        return dropped
+
+    def scaled_timestamps(self, speed):
+        """Event offsets from the replay start at the given speed
+        
+        Args:
+            speed (float): Replay speed multiplier
+        
+        Returns:
+            array: One offset in seconds per event
+        """
+        return array('d', [ts / speed for ts in self.timestamps])
+
+    def _prepare_schedule(self, speed):
+        """Coalesce moves and build the schedule and call plan for a speed
+        
+        The result is cached until the columns change, so repeated passes
+        of replay_multiple and replay_for_hours reuse it.
+        
+        Returns:
+            tuple: (scaled timestamps, call plan)
+        """
+        self.coalesce_moves()
+        if self._schedule is None or self._schedule[0] != speed:
+            self._schedule = (speed, self.scaled_timestamps(speed),
+                              self.call_plan())
+        return self._schedule[1], self._schedule[2]
+
+    @staticmethod
+    def deadlines(target_times, start):
+        """Absolute time.perf_counter deadlines for one replay pass
+        
+        Args:
+            target_times: Offsets returned by scaled_timestamps
+            start (float): time.perf_counter value the pass starts at
+        
+        Returns:
+            array: One deadline per event
+        """
+        return array('d', [start + offset for offset in target_times])
+
+    def event_args(self):
+        """Per-event argument tuples for _execute_event_fast
+        
+        Returns:
+            list: (type_code, x, y, button, pressed, dx, dy) per event
+        """
+        return list(zip(self.type_codes, self.xs, self.ys, self.buttons,
+                        self.pressed, self.dxs, self.dys))
+
+    def call_plan(self):
+        """Lower every event to a handler and its arguments ahead of replay
+        
+        Event types and button names are resolved here once, so the replay
+        loop only calls _run_step on each entry.
+        
+        Returns:
+            list: (handler, args) per event, aligned with the columns
+        """
+        plan_step = self._plan_step
+        return [plan_step(*args) for args in self.event_args()]
+
+    def skip_due_moves(self, index, deadlines, now):
+        """Find the event to execute when replay has fallen behind
+        
+        When every event from index up to the last one already due is a
+        move, only that last move needs replaying; clicks and scrolls are
+        never skipped.
+        
+        Args:
+            index (int): Position of the next event to execute
+            deadlines: Sorted per-event deadlines of the current replay
+            now (float): Current time on the deadlines' clock
+        
+        Returns:
+            int: Index of the event to execute next
+        """
+        due = bisect_right(deadlines, now, index)
+        if (due - index > 1 and
+                self.type_codes[index:due].count(TYPE_MOVE) == due - index):
+            return due - 1
+        return index
+
+    @staticmethod
+    def precise_sleep(seconds, stop_event=None):
+        """Sleep for the given time with sub-millisecond accuracy
+        
+        Args:
+            seconds (float): Time to wait, measured with time.perf_counter
+            stop_event (threading.Event): Optional event that ends the
+                wait early when it is set
+        
+        Returns:
+            bool: True if the wait was cut short by stop_event
+        """
+        deadline = time.perf_counter() + seconds
+        if seconds > SPIN_THRESHOLD:
+            _raise_timer_resolution()
+            if stop_event is None:
+                time.sleep(seconds - SPIN_THRESHOLD)
+            elif stop_event.wait(seconds - SPIN_THRESHOLD):
+                return True
+        while time.perf_counter() < deadline:
+            pass
+        return False
+
+    @staticmethod
+    def load_metadata(filename):
+        """Load only the metadata block of a recording file
+        
+        JSON recordings keep a metadata sidecar next to them, so repeated
+        lookups read a few hundred bytes instead of the recording. On a
+        cache miss only the leading bytes holding the metadata block are
+        decoded, with a streaming or full parse as fallbacks.
+        
+        Event count and duration missing from the metadata are derived
+        from the events, and cached in the sidecar like the rest.
+        
+        Args:
+            filename (str): Path to the recording file
+        
+        Returns:
+            dict: Recording metadata
+        """
+        if _is_jsonl(filename):
+            # The metadata header is always the first line
+            with _open_recording(filename) as f:
+                header = f.readline()
+            metadata = _loads(header).get('metadata', {}) if header else {}
+            return _complete_metadata(filename, metadata)
+
+        st = os.stat(filename)
+        metadata = _read_metadata_sidecar(filename, st)
+        if metadata is not None:
+            return metadata
+
+        with _open_recording(filename) as f:
+            metadata = _metadata_from_prefix(f.read(METADATA_PREFIX_SIZE))
+            if metadata is None:
+                f.seek(0)
+                if ijson is not None:
+                    # Stream the document and stop once the metadata
+                    # object is complete, so the events array is never
+                    # parsed
+                    metadata = {}
+                    for metadata in ijson.items(f, 'metadata',
+                                                use_float=True):
+                        break
+                else:
+                    metadata = _loads(f.read()).get('metadata', {})
+                
+        metadata = _complete_metadata(filename, metadata)
+        _write_metadata_sidecar(filename, st, metadata)
+        return metadata
             
+    @staticmethod
+    def _countdown(seconds):
+        """Print a countdown, one line per second
+        
+        Sleeps in short steps against a monotonic deadline, so Ctrl+C is
+        handled within COUNTDOWN_STEP seconds on every platform.
+        
+        Args:
+            seconds (int): Length of the countdown
+        """
+        deadline = time.monotonic() + seconds
+        for i in range(seconds, 0, -1):
+            print(f"{i}...")
+            tick_end = deadline - (i - 1)
+            remaining = tick_end - time.monotonic()
+            while remaining > 0:
+                time.sleep(min(COUNTDOWN_STEP, remaining))
+                remaining = tick_end - time.monotonic()
+
     def replay(self, speed=1.0, delay_start=3):
         """Replay the recorded mouse events"""
         if not self.recording_data:
@@ -49,43 +839,152 @@ class MouseReplayer:
             return False
             
         self.replay_speed = speed
-        events = self.recording_data['events']
         
-        if not events:
+        if not self.timestamps:
             print("No events to replay")
             return False
             
         print(f"Starting replay in {delay_start} seconds...")
         print("Press Ctrl+C to stop replay")
         
-        # Countdown
-        for i in range(delay_start, 0, -1):
-            print(f"{i}...")
-            time.sleep(1)
+        self._countdown(delay_start)
             
         print("Replaying...")
         
         try:
-            start_time = time.time()
-            last_timestamp = 0
-            
-            for i, event in enumerate(events):
-                # Calculate delay based on timestamp and replay speed
-                target_time = event['timestamp'] / self.replay_speed
-                current_elapsed = time.time() - start_time
-                delay = target_time - current_elapsed
+            # Schedule and arguments come from the column arrays, so the
+            # loop does no per-event dict lookups
+            target_times, plan = self._prepare_schedule(self.replay_speed)
+            execute = self._run_step
+            skip_due_moves = self.skip_due_moves
+            n_events = len(plan)
+            now = time.perf_counter
+            sleep = self.precise_sleep
+            deadlines = self.deadlines(target_times, now())
+            self.reset_position()
+            last_progress = float('-inf')
+            show_progress = self._progress_enabled
+            
+            i = 0
+            while i < n_events:
+                # Sleep until the event's absolute deadline, so scheduling
+                # errors do not accumulate over the recording
+                current = now()
+                delay = deadlines[i] - current
                 
                 if delay > 0:
-                    time.sleep(delay)
+                    sleep(delay)
+                else:
+                    # Behind schedule, jump to the latest overdue move
+                    i = skip_due_moves(i, deadlines, current)
                     
-                self._execute_event(event)
+                execute(*plan[i])
                 
-                # Progress indicator
-                if i % 100 == 0:
-                    progress = (i / len(events)) * 100
-                    print(f"Progress: {progress:.1f}% ({i}/{len(events)})", end='\r')
+                # Progress indicator, throttled by time
+                if (show_progress and
+                        current - last_progress >= PROGRESS_INTERVAL):
+                    last_progress = current
+                    progress = (i / n_events) * 100
+                    print(f"Progress: {progress:.1f}% ({i}/{n_events})", end='\r')
+                i += 1
                     
-            print(f"\nReplay completed! Executed {len(events)} events")
+            print(f"\nReplay completed! Executed {n_events} events")
+            return True
+            
+        except KeyboardInterrupt:
+            print("\nReplay interrupted by user")
+            return False
+        except Exception as e:
+            print(f"\nError during replay: {e}")
+            return False
+            
+    @staticmethod
+    def wants_streaming(fh):
+        """Check whether an opened recording should be replayed streaming
+        
+        Args:
+            fh: File object opened for reading
+        
+        Returns:
+            bool: True for large files that can be parsed incrementally
+        """
+        name = str(getattr(fh, 'name', ''))
+        if not _is_jsonl(name) and ijson is None:
+            return False
+        return os.fstat(fh.fileno()).st_size > STREAMING_THRESHOLD
+
+    def iter_events(self, filename=None):
+        """Yield the events of a recording one at a time
+        
+        JSON Lines files are read line by line and JSON files are parsed
+        incrementally with ijson when it is installed, so memory use does
+        not grow with the recording length.
+        
+        Args:
+            filename (str): Recording to read, defaults to recording_file
+        
+        Yields:
+            dict: One recorded event
+        """
+        return _iter_file_events(filename or self.recording_file)
+
+    def replay_streaming(self, speed=1.0, delay_start=3, filename=None):
+        """Replay a recording while it is being read from disk
+        
+        Args:
+            speed (float): Replay speed multiplier
+            delay_start (int): Countdown in seconds before replaying
+            filename (str): Recording to replay, defaults to recording_file
+        
+        Returns:
+            bool: True if the replay completed
+        """
+        file_to_load = filename or self.recording_file
+        try:
+            metadata = self.load_metadata(file_to_load)
+        except Exception as e:
+            print(f"Error loading recording: {e}")
+            return False
+            
+        self.replay_speed = speed
+        event_count = metadata.get('event_count', 0)
+        
+        print(f"Starting streaming replay in {delay_start} seconds...")
+        print("Press Ctrl+C to stop replay")
+        
+        self._countdown(delay_start)
+            
+        print("Replaying...")
+        
+        try:
+            execute = self._execute_event
+            now = time.perf_counter
+            sleep = self.precise_sleep
+            start_time = now()
+            executed = 0
+            self.reset_position()
+            last_progress = float('-inf')
+            show_progress = self._progress_enabled
+            
+            for event in self.iter_events(file_to_load):
+                current = now()
+                delay = start_time + event['timestamp'] / speed - current
+                
+                if delay > 0:
+                    sleep(delay)
+                    
+                execute(event)
+                
+                # Progress indicator, throttled by time
+                if (show_progress and event_count and
+                        current - last_progress >= PROGRESS_INTERVAL):
+                    last_progress = current
+                    progress = (executed / event_count) * 100
+                    print(f"Progress: {progress:.1f}% "
+                          f"({executed}/{event_count})", end='\r')
+                executed += 1
+                    
+            print(f"\nReplay completed! Executed {executed} events")
             return True
             
         except KeyboardInterrupt:
@@ -152,6 +1051,28 @@ class MouseReplayer:
             print("Replay latency set to 0 (no pause between replays)")
         return True
     
+    def set_coalesce_ms(self, ms):
+        """Set the window used to thin out dense runs of move events
+        
+        Takes effect for the next replay of a freshly loaded recording.
+        
+        Args:
+            ms (float): Window in milliseconds (0 replays every move)
+        
+        Returns:
+            bool: True if successful, False if invalid input
+        """
+        if not isinstance(ms, (int, float)) or ms < 0:
+            print("Move coalescing window must be a non-negative number")
+            return False
+        
+        self.coalesce_window = ms / 1000.0
+        if ms > 0:
+            print(f"Move coalescing window set to: {ms:.1f} ms")
+        else:
+            print("Move coalescing disabled")
+        return True
+    
     def replay_multiple(self, speed=1.0, delay_start=3, times=None):
         """Replay the recorded mouse events multiple times
         
@@ -173,9 +1094,7 @@ class MouseReplayer:
             print("Replay times must be at least 1")
             return False
             
-        events = self.recording_data['events']
-        
-        if not events:
+        if not self.timestamps:
             print("No events to replay")
             return False
             
@@ -184,16 +1103,14 @@ class MouseReplayer:
         print("Press Ctrl+C to stop replay")
         
         # Initial countdown
-        for i in range(delay_start, 0, -1):
-            print(f"{i}...")
-            time.sleep(1)
+        self._countdown(delay_start)
             
         try:
             for replay_num in range(replay_count):
                 print(f"\nReplay {replay_num + 1}/{replay_count}...")
                 
                 # Execute the replay
-                if not self._execute_replay_sequence(events, speed):
+                if not self._execute_replay_sequence(speed):
                     return False
                 
                 # Add configurable pause between replays (except for last one)
@@ -217,35 +1134,49 @@ class MouseReplayer:
             print(f"\nError during replay: {e}")
             return False
     
-    def _execute_replay_sequence(self, events, speed):
-        """Execute a single replay sequence
+    def _execute_replay_sequence(self, speed):
+        """Execute a single replay sequence of the loaded columns
         
         Args:
-            events (list): List of events to replay
             speed (float): Replay speed multiplier
             
         Returns:
             bool: True if successful, False if interrupted
         """
         try:
-            start_time = time.time()
+            target_times, plan = self._prepare_schedule(speed)
+            execute = self._run_step
+            skip_due_moves = self.skip_due_moves
+            n_events = len(plan)
+            now = time.perf_counter
+            sleep = self.precise_sleep
+            deadlines = self.deadlines(target_times, now())
+            self.reset_position()
+            last_progress = float('-inf')
+            show_progress = self._progress_enabled
             
-            for i, event in enumerate(events):
-                # Calculate delay based on timestamp and replay speed
-                target_time = event['timestamp'] / speed
-                current_elapsed = time.time() - start_time
-                delay = target_time - current_elapsed
+            i = 0
+            while i < n_events:
+                # Sleep until the event's absolute deadline
+                current = now()
+                delay = deadlines[i] - current
                 
                 if delay > 0:
-                    time.sleep(delay)
+                    sleep(delay)
+                else:
+                    # Behind schedule, jump to the latest overdue move
+                    i = skip_due_moves(i, deadlines, current)
                     
-                self._execute_event(event)
+                execute(*plan[i])
                 
-                # Progress indicator
-                if i % 100 == 0:
-                    progress = (i / len(events)) * 100
-                    print(f"Progress: {progress:.1f}% ({i}/{len(events)})", 
-                          end='\r')
+                # Progress indicator, throttled by time
+                if (show_progress and
+                        current - last_progress >= PROGRESS_INTERVAL):
+                    last_progress = current
+                    progress = (i / n_events) * 100
+                    print(f"Progress: {progress:.1f}% "
+                          f"({i}/{n_events})", end='\r')
+                i += 1
                     
             return True
             
@@ -277,32 +1208,32 @@ class MouseReplayer:
             print("Replay hours must be greater than 0")
             return False
             
-        events = self.recording_data['events']
-        
-        if not events:
+        if not self.timestamps:
             print("No events to replay")
             return False
             
-        # Calculate end time
-        end_time = time.time() + (replay_hours * 3600)  # Hours to seconds
+        # Calculate end time on the monotonic clock, so wall-clock
+        # adjustments cannot shorten or stretch the run
+        total_seconds = replay_hours * 3600  # Hours to seconds
+        end_time = time.monotonic() + total_seconds
         
         print(f"Starting continuous replay for {replay_hours:.2f} hour(s)...")
         print(f"Speed: {speed}x")
-        end_time_str = time.strftime('%H:%M:%S', time.localtime(end_time))
+        end_time_str = time.strftime(
+            '%H:%M:%S', time.localtime(time.time() + total_seconds)
+        )
         print(f"Will stop at: {end_time_str}")
         print("Press Ctrl+C to stop replay early")
         
         # Initial countdown
-        for i in range(delay_start, 0, -1):
-            print(f"{i}...")
-            time.sleep(1)
+        self._countdown(delay_start)
             
         try:
             replay_count = 0
             
-            while time.time() < end_time:
+            while time.monotonic() < end_time:
                 replay_count += 1
-                remaining_time = end_time - time.time()
+                remaining_time = end_time - time.monotonic()
                 
                 hours_remaining = remaining_time / 3600
                 print(f"\nReplay #{replay_count} (Time remaining: "
@@ -317,11 +1248,11 @@ class MouseReplayer:
                     break
                 
                 # Execute the replay
-                if not self._execute_replay_sequence(events, speed):
+                if not self._execute_replay_sequence(speed):
                     return False
                 
                 # Configurable pause between replays
-                if time.time() < end_time:
+                if time.monotonic() < end_time:
                     if self.replay_latency > 0:
                         print(f"Waiting {self.replay_latency:.2f} seconds "
                               f"before next replay...")
@@ -334,8 +1265,8 @@ class MouseReplayer:
             return True
             
         except KeyboardInterrupt:
-            start_time = end_time - replay_hours * 3600
-            elapsed_hours = (time.time() - start_time) / 3600
+            start_time = end_time - total_seconds
+            elapsed_hours = (time.monotonic() - start_time) / 3600
             print(f"\nReplay interrupted by user after {replay_count} "
                   f"replays ({elapsed_hours:.2f} hours)")
             return False
@@ -345,29 +1276,98 @@ class MouseReplayer:
             
     def _execute_event(self, event):
         """Execute a single mouse event"""
-        event_type = event['type']
+        self._execute_event_fast(
+            TYPE_CODES.get(event['type'], TYPE_UNKNOWN),
+            event.get('x'), event.get('y'),
+            event.get('button'), event.get('pressed'),
+            event.get('dx', 0), event.get('dy', 0)
+        )
+        
+    def _execute_event_fast(self, type_code, x, y, button=None,
+                            pressed=False, dx=0, dy=0):
+        """Execute a single mouse event from its column values
         
+        Args:
+            type_code (int): TYPE_MOVE, TYPE_CLICK or TYPE_SCROLL
+            x, y: Cursor position for the event
+            button (str): Button name for click events
+            pressed (bool): Whether a click event presses or releases
+            dx, dy: Scroll amounts for scroll events
+        """
+        if type_code < 0:
+            return
+            
+        handler, args = self._plan_step(type_code, x, y, button, pressed,
+                                        dx, dy)
         try:
-            if event_type == 'move':
-                self.controller.position = (event['x'], event['y'])
-                
-            elif event_type == 'click':
-                self.controller.position = (event['x'], event['y'])
-                button = Button.left if event['button'] == 'left' else Button.right
-                if event['button'] == 'middle':
-                    button = Button.middle
-                    
-                if event['pressed']:
-                    self.controller.press(button)
-                else:
-                    self.controller.release(button)
-                    
-            elif event_type == 'scroll':
-                self.controller.position = (event['x'], event['y'])
-                self.controller.scroll(event['dx'], event['dy'])
-                
+            handler(*args)
         except Exception as e:
-            print(f"Error executing event {event_type}: {e}")
+            print(f"Error executing event {TYPE_NAMES[type_code]}: {e}")
+            
+    def _plan_step(self, type_code, x, y, button=None, pressed=False,
+                   dx=0, dy=0):
+        """Resolve one event to the handler that replays it
+        
+        Returns:
+            tuple: (handler, args) to be called as handler(*args)
+        """
+        if type_code == TYPE_MOVE:
+            return self._do_move, (x, y)
+        if type_code == TYPE_CLICK:
+            mouse_button = _BUTTON_MAP.get(button, Button.right)
+            handler = self._do_press if pressed else self._do_release
+            return handler, (x, y, mouse_button)
+        if type_code == TYPE_SCROLL:
+            return self._do_scroll, (x, y, dx, dy)
+        return self._do_nothing, ()
+        
+    def _run_step(self, handler, args):
+        """Execute one call plan entry, reporting instead of raising errors"""
+        try:
+            handler(*args)
+        except Exception as e:
+            print(f"Error executing event: {e}")
+            
+    def reset_position(self):
+        """Forget the cached cursor position before a new replay pass
+        
+        The cursor may have been moved by hand since the last pass, so
+        the next event always sets the position again.
+        """
+        self._last_pos = None
+
+    def _move_to(self, x, y):
+        """Set the cursor position unless the last event already did"""
+        pos = (x, y)
+        if pos != self._last_pos:
+            self._set_cursor(x, y)
+            self._last_pos = pos
+
+    def _set_cursor_pynput(self, x, y):
+        """Set the cursor position through the pynput controller"""
+        self.controller.position = (x, y)
+
+    def _do_move(self, x, y):
+        """Move the cursor"""
+        self._move_to(x, y)
+        
+    def _do_press(self, x, y, mouse_button):
+        """Press a mouse button at the given position"""
+        self._move_to(x, y)
+        self.controller.press(mouse_button)
+        
+    def _do_release(self, x, y, mouse_button):
+        """Release a mouse button at the given position"""
+        self._move_to(x, y)
+        self.controller.release(mouse_button)
+            
+    def _do_nothing(self):
+        """Placeholder for events of unknown type"""
+            
+    def _do_scroll(self, x, y, dx, dy):
+        """Scroll at the given position"""
+        self._move_to(x, y)
+        self.controller.scroll(dx, dy)
             
     def replay_with_options(self):
         """Interactive replay with user options"""
@@ -7,13 +7,25 @@ Provides utilities for dynamic module imports and module management.
 import sys
 import importlib.util
 from pathlib import Path
-from typing import Any, Union
+from types import ModuleType
+from typing import Any, Dict, Tuple, Union
+
+# Modules loaded by import_module_from_path, keyed by
+# (module name, resolved file path, file mtime in ns)
+_MODULE_CACHE: Dict[Tuple[str, str, int], ModuleType] = {}
+
+# Loaded modules are registered in sys.modules under this prefix, so a
+# bare name like "mouse_recorder" never shadows an importable module
+_LOADED_PREFIX = "mousecontroller._loaded."
 
 
 def import_module_from_path(module_name: str, file_path: Union[str, Path]) -> Any:
     """
     Import a module from a specific file path.
     
+    Modules are cached per name, path and modification time, so repeated
+    imports of an unchanged file return the already executed module.
+    
     Args:
         module_name: Name to give the imported module
         file_path: Path to the Python file to import
@@ -24,16 +36,35 @@ def import_module_from_path(module_name: str, file_path: Union[str, Path]) -> An
     Raises:
         ImportError: If the module cannot be loaded
     """
-    file_path = Path(file_path)
+    file_path = Path(file_path).resolve()
+    try:
+        key = (module_name, str(file_path), file_path.stat().st_mtime_ns)
+    except OSError as e:
+        raise ImportError(
+            f"Cannot load module {module_name} from {file_path}"
+        ) from e
     
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = _MODULE_CACHE.get(key)
+    if module is not None:
+        return module
+    
+    qualified_name = _LOADED_PREFIX + module_name
+    spec = importlib.util.spec_from_file_location(qualified_name, file_path)
     if spec is None or spec.loader is None:
         raise ImportError(
             f"Cannot load module {module_name} from {file_path}"
         )
     
     module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    # Registered before executing, as the import system does, so the
+    # module can be found by imports it triggers itself
+    sys.modules[qualified_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(qualified_name, None)
+        raise
+    _MODULE_CACHE[key] = module
     return module
 
 
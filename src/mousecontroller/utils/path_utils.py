@@ -80,6 +80,21 @@ def ensure_path_in_sys(path: Union[str, Path]) -> bool:
     return False
 
 
+def _ensure_paths_in_sys(paths) -> None:
+    """
+    Add several paths to sys.path, checking membership against one snapshot.
+    
+    Args:
+        paths: Paths to add, each inserted at the front like ensure_path_in_sys
+    """
+    existing = set(sys.path)
+    for path in paths:
+        str_path = str(Path(path).resolve())
+        if str_path not in existing:
+            sys.path.insert(0, str_path)
+            existing.add(str_path)
+
+
 def setup_project_paths(reference_file: Union[str, Path] = None) -> dict:
     """
     Set up all project paths and add necessary paths to sys.path.
@@ -107,7 +122,6 @@ def setup_project_paths(reference_file: Union[str, Path] = None) -> dict:
     }
     
     # Add necessary paths to sys.path
-    ensure_path_in_sys(paths['src'])
-    ensure_path_in_sys(paths['mousecontroller'])
+    _ensure_paths_in_sys((paths['src'], paths['mousecontroller']))
     
     return paths
\ No newline at end of file
@@ -4,6 +4,7 @@ Tests for test main module.
 
 import pytest
 from src.mousecontroller.main import main
+import src.mousecontroller.main as main_module
 
 
 def test_main():
@@ -21,3 +22,22 @@ def test_main_output(capsys):
     main()
     captured = capsys.readouterr()
     assert "Hello from mousecontroller!" in captured.out
+
+
+def test_menu_record(monkeypatch):
+    """Test that the interactive record entry starts a recording."""
+    started = []
+
+    class StubRecorder:
+        event_count = 0
+
+        def __init__(self, output_file, verbose=False):
+            started.append((output_file, verbose))
+
+        def start_recording(self):
+            pass
+
+    monkeypatch.setattr(main_module, "MouseRecorder", StubRecorder)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "")
+    main_module._menu_record()
+    assert started == [("data/mouse_recording.json", False)]
@@ -1,149 +1,34 @@
 #!/usr/bin/env python3
 """
 Test script to validate mouse recorder and replayer functionality
-"""
 
-import os
-import json
-import tempfile
-import sys
-from pathlib import Path
+Loading, saving and replay scheduling are covered by
+test_mouse_recorder_unittest.py; this module checks construction for a
+plain and a data directory output path.
+"""
 
-# Add src to path before any imports
-src_path = Path(__file__).parent.parent / "src"
-mousecontroller_path = src_path / "mousecontroller"
-sys.path.insert(0, str(src_path))
-sys.path.insert(0, str(mousecontroller_path))
+import pytest
 
-# Import utilities and classes
-from mousecontroller.utils import get_mousecontroller_modules
+from mousecontroller.mouse_recorder import MouseRecorder
+from mousecontroller.mouse_replayer import MouseReplayer
 
-# Import our modules dynamically
-try:
-    MouseRecorder, MouseReplayer = get_mousecontroller_modules(
-        mousecontroller_path
-    )
-except ImportError as e:
-    print(f"Error importing modules: {e}")
-    sys.exit(1)
+# Output paths used for construction, one in the working directory and
+# one inside the data directory (created on save, not on construction)
+RECORDING_FILES = ["test_recording.json", "data/test_output.json"]
 
 
-def test_recorder_creation():
+@pytest.mark.parametrize("filename", RECORDING_FILES)
+def test_recorder_creation(filename):
     """Test that MouseRecorder can be created"""
-    print("Testing MouseRecorder creation...")
-    recorder = MouseRecorder("test_recording.json")
-    assert recorder.output_file == "test_recording.json"
+    recorder = MouseRecorder(filename)
+    assert recorder.output_file == filename
     assert recorder.events == []
     assert not recorder.recording
-    print("✓ MouseRecorder creation test passed")
 
 
-def test_replayer_creation():
+@pytest.mark.parametrize("filename", RECORDING_FILES)
+def test_replayer_creation(filename):
     """Test that MouseReplayer can be created"""
-    print("Testing MouseReplayer creation...")
-    replayer = MouseReplayer("test_recording.json")
-    assert replayer.recording_file == "test_recording.json"
+    replayer = MouseReplayer(filename)
+    assert replayer.recording_file == filename
     assert replayer.recording_data is None
-    print("✓ MouseReplayer creation test passed")
-
-
-def test_json_format():
-    """Test the JSON format with mock data"""
-    print("Testing JSON format...")
-    
-    # Create mock recording data
-    mock_data = {
-        "metadata": {
-            "created_at": "2025-09-26T10:30:45.123456",
-            "duration": 5.0,
-            "event_count": 3
-        },
-        "events": [
-            {
-                "type": "move",
-                "x": 100,
-                "y": 200,
-                "timestamp": 0.5
-            },
-            {
-                "type": "click",
-                "x": 150,
-                "y": 250,
-                "button": "left",
-                "pressed": True,
-                "timestamp": 1.0
-            },
-            {
-                "type": "click",
-                "x": 150,
-                "y": 250,
-                "button": "left",
-                "pressed": False,
-                "timestamp": 1.1
-            }
-        ]
-    }
-    
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(mock_data, f)
-        temp_file = f.name
-    
-    try:
-        # Test loading with replayer
-        replayer = MouseReplayer(temp_file)
-        success = replayer.load_recording()
-        
-        assert success == True
-        assert replayer.recording_data is not None
-        assert replayer.recording_data['metadata']['event_count'] == 3
-        assert len(replayer.recording_data['events']) == 3
-        
-        print("✓ JSON format test passed")
-        
-    finally:
-        # Clean up
-        os.unlink(temp_file)
-
-
-def test_data_directory():
-    """Test that data directory gets created"""
-    print("Testing data directory creation...")
-    
-    # This should create the data directory
-    recorder = MouseRecorder("data/test_output.json")
-    
-    # The directory should exist after creating a recorder (it creates on save)
-    # For now, just test the path is set correctly
-    expected_path = "data/test_output.json"
-    assert recorder.output_file == expected_path
-    
-    print("✓ Data directory test passed")
-
-
-def run_all_tests():
-    """Run all tests"""
-    print("Running mouse recorder/replayer tests...")
-    print("=" * 50)
-    
-    try:
-        test_recorder_creation()
-        test_replayer_creation()
-        test_json_format()
-        test_data_directory()
-        
-        print("=" * 50)
-        print("✅ All tests passed!")
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-        
-    return True
-
-
-if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
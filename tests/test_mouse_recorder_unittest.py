@@ -4,98 +4,313 @@ Alternative test script using standard Python test patterns
 """
 
 import unittest
+import io
 import os
 import json
 import tempfile
-import sys
-from pathlib import Path
+from array import array
 
-# Ensure we can import our modules
-project_root = Path(__file__).parent.parent
-src_path = project_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+try:
+    import orjson
+except ImportError:  # Optional dependency, fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+from pynput.mouse import Button
 
 from mousecontroller.mouse_recorder import MouseRecorder
-from mousecontroller.mouse_replayer import MouseReplayer
+from mousecontroller.mouse_replayer import (
+    COLUMN_CACHE_MIN_SIZE, MMAP_MIN_SIZE, MouseReplayer,
+    _load_small_recording,
+)
+
+
+def _dumps(obj):
+    """Encode a fixture as JSON bytes, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+# Three event recording shared by the JSON format tests, and its encoding
+MOCK_DATA = {
+    "metadata": {
+        "created_at": "2025-09-26T10:30:45.123456",
+        "duration": 5.0,
+        "event_count": 3
+    },
+    "events": [
+        {
+            "type": "move",
+            "x": 100,
+            "y": 200,
+            "timestamp": 0.5
+        },
+        {
+            "type": "click",
+            "x": 150,
+            "y": 250,
+            "button": "left",
+            "pressed": True,
+            "timestamp": 1.0
+        },
+        {
+            "type": "click",
+            "x": 150,
+            "y": 250,
+            "button": "left",
+            "pressed": False,
+            "timestamp": 1.1
+        }
+    ]
+}
+MOCK_JSON_BYTES = _dumps(MOCK_DATA)
+
+
+def _write_temp_file(data, suffix):
+    """Write bytes to a new temp file in one os.write and return its path"""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return path
+
+
+def _write_synthetic_recording(path, count):
+    """Write a JSON recording of count moves, one event at a time
+
+    Events are encoded as they are written, so large fixtures never exist
+    as a list of dicts in memory.
+    """
+    metadata = {"duration": (count - 1) * 0.01, "event_count": count}
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(b'{"metadata":' + _dumps(metadata) + b',"events":[')
+        for i in range(count):
+            if i:
+                f.write(b',')
+            f.write(_dumps({"type": "move", "x": i, "y": i * 2,
+                            "timestamp": i * 0.01}))
+        f.write(b']}')
 
 
 class TestMouseRecorder(unittest.TestCase):
     """Test cases for MouseRecorder class"""
 
-    def test_recorder_creation(self):
-        """Test that MouseRecorder can be created"""
-        recorder = MouseRecorder("test_recording.json")
-        self.assertEqual(recorder.output_file, "test_recording.json")
-        self.assertEqual(recorder.events, [])
-        self.assertFalse(recorder.recording)
+    @classmethod
+    def setUpClass(cls):
+        """Write the shared JSON fixture once for the whole class"""
+        cls.temp_file = _write_temp_file(MOCK_JSON_BYTES, '.json')
 
-    def test_replayer_creation(self):
-        """Test that MouseReplayer can be created"""
-        replayer = MouseReplayer("test_recording.json")
-        self.assertEqual(replayer.recording_file, "test_recording.json")
-        self.assertIsNone(replayer.recording_data)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared JSON fixture"""
+        os.unlink(cls.temp_file)
 
     def test_json_format(self):
         """Test the JSON format with mock data"""
-        # Create mock recording data
+        # Test loading the shared fixture with replayer
+        replayer = MouseReplayer(self.temp_file)
+        success = replayer.load_recording()
+
+        self.assertTrue(success)
+        self.assertEqual(replayer.recording_data,
+                         {"metadata": MOCK_DATA["metadata"]})
+        self.assertEqual(replayer.events, MOCK_DATA["events"])
+        self.assertEqual(replayer.types, ['move', 'click', 'click'])
+        self.assertEqual(list(replayer.timestamps), [0.5, 1.0, 1.1])
+
+    def test_parsed_recording_cached(self):
+        """Test that reloading an unchanged file reuses the parsed data"""
+        first = MouseReplayer(self.temp_file)
+        self.assertTrue(first.load_recording())
+        hits = _load_small_recording.cache_info().hits
+        second = MouseReplayer(self.temp_file)
+        self.assertTrue(second.load_recording())
+        self.assertEqual(_load_small_recording.cache_info().hits, hits + 1)
+        self.assertEqual(second.recording_data, first.recording_data)
+        self.assertEqual(second.types, ['move', 'click', 'click'])
+
+    def test_jsonl_format(self):
+        """Test loading a JSON Lines recording"""
+        lines = [
+            '{"metadata": {"created_at": "2025-09-26T10:30:45.123456", '
+            '"duration": 1.0, "event_count": 2}}',
+            '{"type": "move", "x": 100, "y": 200, "timestamp": 0.5}',
+            '{"type": "scroll", "x": 100, "y": 200, "dx": 0, "dy": -1, '
+            '"timestamp": 0.9}'
+        ]
+
+        temp_file = _write_temp_file(("\n".join(lines) + "\n").encode(), '.jsonl')
+
+        try:
+            replayer = MouseReplayer(temp_file)
+            self.assertTrue(replayer.load_recording())
+            if replayer.recording_data:  # Type guard for linter
+                self.assertEqual(replayer.recording_data['metadata']['event_count'], 2)
+            self.assertEqual(len(replayer.events), 2)
+            metadata = MouseReplayer.load_metadata(temp_file)
+            self.assertEqual(metadata['duration'], 1.0)
+            streamed = [event['type'] for event in replayer.iter_events()]
+            self.assertEqual(streamed, ['move', 'scroll'])
+
+        finally:
+            os.unlink(temp_file)
+
+    def test_mmap_load_equivalence(self):
+        """Test that a memory-mapped load matches a buffered read"""
+        with tempfile.TemporaryDirectory() as tmp:
+            temp_file = os.path.join(tmp, "recording.json")
+            _write_synthetic_recording(temp_file, 2000)
+            with open(temp_file, 'rb') as f:
+                data = f.read()
+            self.assertGreaterEqual(len(data), MMAP_MIN_SIZE)
+
+            mapped = MouseReplayer(temp_file)
+            self.assertTrue(mapped.load_recording())
+            buffered = MouseReplayer(temp_file)
+            self.assertTrue(buffered.load_from_handle(io.BytesIO(data)))
+
+        self.assertEqual(mapped.recording_data, buffered.recording_data)
+        self.assertEqual(mapped.xs, buffered.xs)
+        self.assertEqual(mapped.timestamps, buffered.timestamps)
+        self.assertEqual(mapped.file_size, buffered.file_size)
+
+    def test_column_cache_load_matches_parse(self):
+        """Test that a load from the column cache exposes the same data"""
+        with tempfile.TemporaryDirectory() as tmp:
+            temp_file = os.path.join(tmp, "recording.json")
+            _write_synthetic_recording(temp_file, 25000)
+            self.assertGreaterEqual(os.path.getsize(temp_file),
+                                    COLUMN_CACHE_MIN_SIZE)
+
+            parsed = MouseReplayer(temp_file)
+            self.assertTrue(parsed.load_recording())
+            cached = MouseReplayer(temp_file)
+            self.assertTrue(cached._load_column_cache(
+                temp_file, os.stat(temp_file)))
+
+        self.assertEqual(cached.recording_data, parsed.recording_data)
+        self.assertEqual(list(cached.recording_data), ['metadata'])
+        self.assertEqual(cached.events[-1], parsed.events[-1])
+        self.assertEqual(len(cached.events), 25000)
+
+    def test_gzip_jsonl_roundtrip(self):
+        """Test that a compressed JSON Lines recording replays"""
+        with tempfile.TemporaryDirectory() as tmp:
+            temp_file = os.path.join(tmp, "recording.jsonl.gz")
+            recorder = MouseRecorder(temp_file)
+            recorder.recording = True
+            recorder.on_move(100, 200)
+            recorder.on_scroll(100, 200, 0, -1)
+            recorder.save_recording()
+
+            replayer = MouseReplayer(temp_file)
+            self.assertTrue(replayer.load_recording())
+            self.assertEqual(replayer.types, ['move', 'scroll'])
+            self.assertEqual(
+                MouseReplayer.load_metadata(temp_file)['event_count'], 2
+            )
+            streamed = [event['type'] for event in replayer.iter_events()]
+            self.assertEqual(streamed, ['move', 'scroll'])
+
+    def test_metadata_sidecar(self):
+        """Test that JSON metadata is cached in a sidecar file"""
+        mock_data = {
+            "metadata": {"duration": 2.0, "event_count": 0},
+            "events": []
+        }
+
+        temp_file = _write_temp_file(_dumps(mock_data), '.json')
+        sidecar = temp_file + '.meta.json'
+
+        try:
+            self.assertEqual(MouseReplayer.load_metadata(temp_file)['duration'], 2.0)
+            self.assertTrue(os.path.exists(sidecar))
+            self.assertEqual(MouseReplayer.load_metadata(temp_file)['duration'], 2.0)
+
+        finally:
+            os.unlink(temp_file)
+            if os.path.exists(sidecar):
+                os.unlink(sidecar)
+
+    def test_metadata_derived_from_events(self):
+        """Test that missing metadata is filled in from the events"""
         mock_data = {
-            "metadata": {
-                "created_at": "2025-09-26T10:30:45.123456",
-                "duration": 5.0,
-                "event_count": 3
-            },
             "events": [
-                {
-                    "type": "move",
-                    "x": 100,
-                    "y": 200,
-                    "timestamp": 0.5
-                },
-                {
-                    "type": "click",
-                    "x": 150,
-                    "y": 250,
-                    "button": "left",
-                    "pressed": True,
-                    "timestamp": 1.0
-                },
-                {
-                    "type": "click",
-                    "x": 150,
-                    "y": 250,
-                    "button": "left",
-                    "pressed": False,
-                    "timestamp": 1.1
-                }
+                {"type": "move", "x": 1, "y": 2, "timestamp": 0.5},
+                {"type": "move", "x": 3, "y": 4, "timestamp": 1.5}
             ]
         }
 
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(mock_data, f)
-            temp_file = f.name
+        temp_file = _write_temp_file(_dumps(mock_data), '.json')
+        sidecar = temp_file + '.meta.json'
 
         try:
-            # Test loading with replayer
-            replayer = MouseReplayer(temp_file)
-            success = replayer.load_recording()
-
-            self.assertTrue(success)
-            self.assertIsNotNone(replayer.recording_data)
-            if replayer.recording_data:  # Type guard for linter
-                self.assertEqual(replayer.recording_data['metadata']['event_count'], 3)
-                self.assertEqual(len(replayer.recording_data['events']), 3)
+            metadata = MouseReplayer.load_metadata(temp_file)
+            self.assertEqual(metadata['event_count'], 2)
+            self.assertEqual(metadata['duration'], 1.5)
 
         finally:
-            # Clean up
             os.unlink(temp_file)
+            if os.path.exists(sidecar):
+                os.unlink(sidecar)
 
-    def test_data_directory_path(self):
-        """Test that data directory path is set correctly"""
-        recorder = MouseRecorder("data/test_output.json")
-        expected_path = "data/test_output.json"
-        self.assertEqual(recorder.output_file, expected_path)
+    def test_skip_due_moves(self):
+        """Test that overdue moves collapse but clicks are kept"""
+        replayer = MouseReplayer("test_recording.json")
+        replayer.type_codes = array('b', [0, 0, 0, 1, 0])
+        deadlines = array('d', [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        self.assertEqual(replayer.skip_due_moves(0, deadlines, 3.5), 2)
+        self.assertEqual(replayer.skip_due_moves(0, deadlines, 4.5), 0)
+        self.assertEqual(replayer.skip_due_moves(0, deadlines, 0.5), 0)
+
+    def test_coalesce_moves(self):
+        """Test that dense moves are thinned but the last move and clicks stay"""
+        replayer = MouseReplayer("test_recording.json")
+        events = [
+            {"type": "move", "x": i, "y": 0, "timestamp": i * 0.004}
+            for i in range(9)
+        ]
+        events.append({"type": "click", "x": 8, "y": 0, "button": "left",
+                       "pressed": True, "timestamp": 0.05})
+        replayer._build_columns(events)
+
+        self.assertEqual(replayer.coalesce_moves(), 6)
+        self.assertEqual(list(replayer.xs), [0, 4, 8, 8])
+        self.assertEqual(replayer.types[-1], 'click')
+
+    def test_recorded_events(self):
+        """Test that callback columns rebuild the saved event dicts"""
+        recorder = MouseRecorder("test_recording.json")
+        recorder.recording = True
+        recorder.on_move(100, 200)
+        recorder.on_click(100, 200, Button.left, True)
+        recorder.on_scroll(100, 200, 0, -1)
+
+        events = recorder.events
+        self.assertEqual(recorder.event_count, 3)
+        self.assertEqual([event['type'] for event in events],
+                         ['move', 'click', 'scroll'])
+        self.assertEqual(events[0]['x'], 100)
+        self.assertEqual(events[1]['button'], 'left')
+        self.assertTrue(events[1]['pressed'])
+        self.assertEqual(events[2]['dy'], -1)
+
+    def test_move_jitter_dropped(self):
+        """Test that jittery moves collapse to their last sample"""
+        recorder = MouseRecorder("test_recording.json")
+        clock = iter([0, 1_000_000, 2_000_000, 3_000_000, 20_000_000])
+        recorder._clock_ns = lambda: next(clock)
+        recorder.recording = True
+        recorder.on_move(100, 100)
+        recorder.on_move(101, 100)
+        recorder.on_move(100, 101)
+        recorder.on_move(150, 150)
+        recorder.on_move(151, 150)
+
+        self.assertEqual([event['y'] for event in recorder.events],
+                         [100, 101, 150, 150])
 
 
 class TestMouseRecorderIntegration(unittest.TestCase):
@@ -103,7 +318,10 @@ class TestMouseRecorderIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        self.test_file = "test_recording.json"
+        # A unique path per test, so parallel workers (pytest -n) never
+        # share an output file
+        fd, self.test_file = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
         self.recorder = MouseRecorder(self.test_file)
 
     def tearDown(self):
@@ -113,20 +331,16 @@ class TestMouseRecorderIntegration(unittest.TestCase):
 
     def test_event_structure(self):
         """Test that events have the correct structure"""
-        # Simulate adding events manually (since we can't actually move mouse in tests)
-        test_event = {
-            "type": "move",
-            "x": 100,
-            "y": 200,
-            "timestamp": 1.0
-        }
-        self.recorder.events.append(test_event)
+        # Feed the listener callback directly (since we can't actually
+        # move the mouse in tests); events are rebuilt from the columns
+        self.recorder.recording = True
+        self.recorder.on_move(100, 200)
+        event = self.recorder.events[0]
 
-        # Test event structure
-        self.assertIn("type", test_event)
-        self.assertIn("x", test_event)
-        self.assertIn("y", test_event)
-        self.assertIn("timestamp", test_event)
+        # Test event structure with a single key-set comparison
+        self.assertEqual(set(event), {"type", "x", "y", "timestamp"})
+        self.assertEqual((event["type"], event["x"], event["y"]),
+                         ("move", 100, 200))
 
 
 if __name__ == "__main__":